@@ -1,9 +1,19 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
 from .models import AdminProfile, ContractorAccessToken, OTPToken, TenantProfile, User
 
 
+class UserChangeList(ChangeList):
+    """Changelist that only loads the columns it displays."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).only(
+            "id", *self.model_admin.list_display
+        )
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ("username", "email", "first_name", "last_name", "role", "is_active")
@@ -20,27 +30,34 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return UserChangeList
+
 
 @admin.register(TenantProfile)
 class TenantProfileAdmin(admin.ModelAdmin):
     list_display = ("user", "emergency_contact_name", "move_in_date")
+    list_select_related = ("user",)
     search_fields = ("user__username", "user__email", "user__first_name", "user__last_name")
 
 
 @admin.register(AdminProfile)
 class AdminProfileAdmin(admin.ModelAdmin):
     list_display = ("user", "otp_enabled", "otp_delivery")
+    list_select_related = ("user",)
 
 
 @admin.register(OTPToken)
 class OTPTokenAdmin(admin.ModelAdmin):
     list_display = ("user", "purpose", "delivery_method", "is_used", "expires_at", "created_at")
     list_filter = ("purpose", "delivery_method", "is_used")
-    readonly_fields = ("code",)
+    list_select_related = ("user",)
+    readonly_fields = ("code_hash",)
 
 
 @admin.register(ContractorAccessToken)
 class ContractorAccessTokenAdmin(admin.ModelAdmin):
     list_display = ("contractor_name", "work_order", "is_revoked", "expires_at", "last_accessed_at")
     list_filter = ("is_revoked",)
+    list_select_related = ("work_order",)
     search_fields = ("contractor_name", "contractor_email")
@@ -13,25 +13,26 @@ class PasswordlessOTPBackend(BaseBackend):
 
         from apps.accounts.models import OTPToken
 
+        # Match and claim in one conditional UPDATE: the stored value is a
+        # keyed digest, so comparing it in SQL reveals nothing about the code,
+        # and the is_used=False predicate keeps each code single-use
+        claimed = OTPToken.objects.valid().filter(
+            user_id=user_id,
+            code_hash=OTPToken.hash_code(otp_code),
+        ).update(is_used=True)
+        if not claimed:
+            return None
+
         try:
-            user = User.objects.get(pk=user_id, is_active=True)
+            return User.objects.get(pk=user_id, is_active=True)
         except User.DoesNotExist:
             return None
 
-        token = OTPToken.objects.filter(
-            user=user,
-            code=otp_code,
-            is_used=False,
-        ).order_by("-created_at").first()
-
-        if token and token.is_valid:
-            token.is_used = True
-            token.save(update_fields=["is_used"])
-            return user
-
-        return None
-
     def get_user(self, user_id):
+        # Runs once per request (AuthenticationMiddleware caches the result on
+        # request._cached_user). The full row is fetched on purpose: templates
+        # and views read most User columns, and deferring any of them with
+        # .only() would cost an extra query per deferred attribute accessed.
         try:
             return User.objects.get(pk=user_id)
         except User.DoesNotExist:
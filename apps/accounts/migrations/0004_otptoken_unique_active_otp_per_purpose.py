@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:52
+
+from django.db import migrations, models
+
+
+def invalidate_duplicate_active_tokens(apps, schema_editor):
+    """Keep only the newest unused token per user/purpose."""
+    OTPToken = apps.get_model("accounts", "OTPToken")
+
+    seen = set()
+    stale_ids = []
+    active = OTPToken.objects.filter(is_used=False).order_by("-created_at")
+    for pk, user_id, purpose in active.values_list("pk", "user_id", "purpose"):
+        if (user_id, purpose) in seen:
+            stale_ids.append(pk)
+        else:
+            seen.add((user_id, purpose))
+    OTPToken.objects.filter(pk__in=stale_ids).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_add_tenant_personal_info'),
+    ]
+
+    operations = [
+        migrations.RunPython(invalidate_duplicate_active_tokens, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='otptoken',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_used', False)), fields=('user', 'purpose'), name='unique_active_otp_per_purpose'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_otptoken_unique_active_otp_per_purpose'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otptoken',
+            index=models.Index(fields=['user', 'is_used', '-created_at'], name='accounts_ot_user_id_9565fd_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:04
+
+from django.db import migrations, models
+
+
+def retire_unused_tokens(apps, schema_editor):
+    """Outstanding plaintext codes can't be carried over; they expire shortly anyway."""
+    OTPToken = apps.get_model("accounts", "OTPToken")
+    OTPToken.objects.filter(is_used=False).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_otptoken_user_is_used_created_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(retire_unused_tokens, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='otptoken',
+            name='code',
+        ),
+        migrations.AddField(
+            model_name='otptoken',
+            name='code_hash',
+            field=models.CharField(default='', max_length=32),
+            preserve_default=False,
+        ),
+    ]
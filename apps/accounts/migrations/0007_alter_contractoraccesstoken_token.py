@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_otptoken_code_hash'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contractoraccesstoken',
+            name='token',
+            field=models.CharField(max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:20
+
+from django.db import migrations, models
+
+
+def retire_unused_tokens(apps, schema_editor):
+    """Outstanding hex digests aren't carried over; they expire shortly anyway."""
+    OTPToken = apps.get_model("accounts", "OTPToken")
+    OTPToken.objects.filter(is_used=False).update(is_used=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_alter_user_id_uuid7'),
+    ]
+
+    operations = [
+        migrations.RunPython(retire_unused_tokens, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='otptoken',
+            name='code_hash',
+        ),
+        migrations.AddField(
+            model_name='otptoken',
+            name='code_hash',
+            field=models.BinaryField(default=b'', max_length=16),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:26
+
+from django.db import migrations
+
+# Columns searched with icontains by UserAdmin and the admin tenant list.
+# Django renders icontains on PostgreSQL as UPPER(col::text) LIKE UPPER(%s),
+# so the trigram indexes are built on the same expression.
+SEARCH_COLUMNS = ["username", "email", "first_name", "last_name", "phone_number"]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS accounts_user_{column}_trgm '
+            f'ON accounts_user USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS accounts_user_{column}_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_otptoken_code_hash_binary'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
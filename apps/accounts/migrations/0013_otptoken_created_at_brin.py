@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:42
+
+from django.db import migrations
+
+# OTP tokens are insert-only in created_at order, so a BRIN index covers the
+# purge task's created_at range scan at a fraction of a btree's size.
+
+
+def create_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS accounts_otptoken_created_brin "
+        "ON accounts_otptoken USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS accounts_otptoken_created_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_user_manager'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_otptoken_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='otptoken',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+    ]
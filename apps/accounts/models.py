@@ -1,15 +1,23 @@
+import hashlib
 import secrets
-import uuid
 
 from django.conf import settings
-from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
+from django.db import models, transaction
+from django.db.models.functions import Cast, Upper
 from django.utils import timezone
 
-from apps.core.models import TimeStampedModel
+from apps.core.models import TimeStampedModel, uuid7
 from apps.core.validators import validate_phone_number
 
 
+class UserManager(DjangoUserManager):
+    def get_by_natural_key(self, username):
+        # Password logins resolve the user here; admin login checks the
+        # admin profile's OTP settings straight afterwards, so join it now
+        return self.select_related("admin_profile").get(**{self.model.USERNAME_FIELD: username})
+
+
 class User(AbstractUser):
     ROLE_CHOICES = [
         ("tenant", "Tenant"),
@@ -21,7 +29,7 @@ class User(AbstractUser):
         ("sms", "SMS"),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default="tenant", db_index=True)
     phone_number = models.CharField(
         max_length=20, blank=True, default="", validators=[validate_phone_number]
@@ -32,8 +40,19 @@ class User(AbstractUser):
         max_length=5, choices=CONTACT_CHOICES, default="email"
     )
 
+    objects = UserManager()
+
     class Meta:
         ordering = ["last_name", "first_name"]
+        indexes = [
+            # Tenant login looks users up by email__iexact, which PostgreSQL
+            # evaluates as UPPER(email::text), or by exact phone number
+            models.Index(
+                Upper(Cast("email", output_field=models.TextField())),
+                name="accounts_user_email_upper_idx",
+            ),
+            models.Index(fields=["phone_number"], name="accounts_user_phone_idx"),
+        ]
 
     def __str__(self):
         return self.get_full_name() or self.username
@@ -97,6 +116,12 @@ class AdminProfile(TimeStampedModel):
         return f"Admin Profile: {self.user}"
 
 
+class OTPTokenQuerySet(models.QuerySet):
+    def valid(self):
+        """Unused, unexpired tokens; the database equivalent of ``is_valid``."""
+        return self.filter(is_used=False, expires_at__gt=timezone.now())
+
+
 class OTPToken(TimeStampedModel):
     PURPOSE_CHOICES = [
         ("login", "Login"),
@@ -107,17 +132,32 @@ class OTPToken(TimeStampedModel):
         ("sms", "SMS"),
     ]
 
+    # No btree on created_at: the purge task's range delete uses the
+    # PostgreSQL BRIN index accounts_otptoken_created_brin instead
+    created_at = models.DateTimeField(auto_now_add=True)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="otp_tokens"
     )
-    code = models.CharField(max_length=6)
+    code_hash = models.BinaryField(max_length=16)
     purpose = models.CharField(max_length=5, choices=PURPOSE_CHOICES)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
     delivery_method = models.CharField(max_length=5, choices=DELIVERY_CHOICES, default="email")
 
+    objects = OTPTokenQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "purpose"],
+                condition=models.Q(is_used=False),
+                name="unique_active_otp_per_purpose",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "is_used", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"OTP for {self.user} ({self.purpose})"
@@ -130,27 +170,46 @@ class OTPToken(TimeStampedModel):
     def is_valid(self):
         return not self.is_used and not self.is_expired
 
+    @staticmethod
+    def hash_code(code):
+        """Keyed BLAKE2b digest of an OTP code; plaintext codes are never stored."""
+        key = hashlib.sha256(settings.OTP_PEPPER.encode()).digest()
+        return hashlib.blake2b(code.encode(), key=key, digest_size=16).digest()
+
     @classmethod
     def generate(cls, user, purpose="login", delivery_method="email"):
+        """
+        Create a fresh token, invalidating any unused one for the same purpose.
+
+        The plaintext code is only available as ``code`` on the returned
+        instance, for delivery to the user.
+        """
         if settings.DEBUG:
             code = getattr(settings, "DEV_OTP_CODE", "123456")
         else:
-            import secrets
-            code = "".join([str(secrets.randbelow(10)) for _ in range(settings.OTP_LENGTH)])
+            code = f"{secrets.randbelow(10 ** settings.OTP_LENGTH):0{settings.OTP_LENGTH}d}"
         expires_at = timezone.now() + timezone.timedelta(minutes=settings.OTP_EXPIRY_MINUTES)
-        # Invalidate existing unused tokens for this user/purpose
-        cls.objects.filter(user=user, purpose=purpose, is_used=False).update(is_used=True)
-        return cls.objects.create(
-            user=user,
-            code=code,
-            purpose=purpose,
-            expires_at=expires_at,
-            delivery_method=delivery_method,
-        )
+        with transaction.atomic():
+            # Lock the user row so overlapping requests for the same user run
+            # invalidate+create in turn; otherwise both would INSERT and the
+            # second would violate unique_active_otp_per_purpose
+            User.objects.select_for_update().filter(pk=user.pk).values_list("pk", flat=True).get()
+            # Invalidate the existing unused token for this user/purpose
+            # (at most one, enforced by unique_active_otp_per_purpose)
+            cls.objects.filter(user=user, purpose=purpose, is_used=False).update(is_used=True)
+            token = cls.objects.create(
+                user=user,
+                code_hash=cls.hash_code(code),
+                purpose=purpose,
+                expires_at=expires_at,
+                delivery_method=delivery_method,
+            )
+        token.code = code
+        return token
 
 
 class ContractorAccessToken(TimeStampedModel):
-    token = models.CharField(max_length=64, unique=True, db_index=True)
+    token = models.CharField(max_length=64, unique=True)
     contractor_name = models.CharField(max_length=200)
     contractor_phone = models.CharField(
         max_length=20, blank=True, default="", validators=[validate_phone_number]
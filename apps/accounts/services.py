@@ -7,7 +7,55 @@ Provides functions for:
 - Archiving and restoring tenants
 """
 
-from django.utils import timezone
+from functools import cache
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    IntegerField,
+    OuterRef,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from .models import TenantProfile
+
+# Invoice statuses that still have money owed and block deletion
+UNPAID_STATUSES = ("pending", "issued", "overdue", "partial")
+
+# (related accessor on User, key in the delete summary)
+SUMMARY_RELATIONS = [
+    ("emergency_contacts", "emergency_contacts"),
+    ("vehicles", "vehicles"),
+    ("employment_records", "employment_records"),
+    ("insurance_policies", "insurance_policies"),
+    ("id_verifications", "id_verifications"),
+    ("onboarding_sessions", "onboarding_sessions"),
+    ("otp_tokens", "otp_tokens"),
+    ("notifications", "notifications"),
+]
+
+
+@cache
+def _summary_relations():
+    """
+    SUMMARY_RELATIONS filtered to reverse relations that exist on User.
+
+    The schema is fixed once the app registry is ready, so this is resolved
+    on first use instead of probing the model on every call.
+    """
+    accessors = {
+        field.get_accessor_name()
+        for field in get_user_model()._meta.get_fields()
+        if field.auto_created and not field.concrete
+    }
+    return tuple(
+        (accessor, key) for accessor, key in SUMMARY_RELATIONS if accessor in accessors
+    )
 
 
 def can_delete_tenant(user):
@@ -21,108 +69,128 @@ def can_delete_tenant(user):
 
     These constraints prevent deletion to preserve business data integrity.
     """
-    # Check for any leases (PROTECT)
-    if user.leases.exists():
-        return False
+    User = get_user_model()
+    can_delete = (
+        annotate_can_delete(User.objects.filter(pk=user.pk))
+        .values_list("can_delete", flat=True)
+        .first()
+    )
+    return can_delete is None or can_delete
+
+
+def annotate_can_delete(queryset):
+    """
+    Annotate a User queryset with ``can_delete`` (see ``can_delete_tenant``).
+
+    Each blocker is an EXISTS subquery, so a whole tenant list is checked in
+    the same query that fetches it.
+    """
+    User = queryset.model
+    # Any leases or payments (PROTECT), or unpaid invoices
+    no_blockers = (
+        ~Exists(_related_queryset(User, "leases"))
+        & ~Exists(_related_queryset(User, "payments"))
+        & ~Exists(_related_queryset(User, "invoices", status__in=UNPAID_STATUSES))
+    )
+    return queryset.annotate(
+        can_delete=ExpressionWrapper(no_blockers, output_field=BooleanField())
+    )
+
+
+def get_related_counts(user):
+    """
+    Count a tenant's related records in a single query.
+
+    Each relation is counted with a correlated subquery so the joins don't
+    multiply against each other. Relations whose app isn't installed are
+    skipped and reported as absent from the result.
+
+    Returns a dict keyed by relation name (plus ``unpaid_invoices`` and
+    ``profile``).
+    """
+    User = get_user_model()
+    annotations = {
+        "leases": _count_related(User, "leases"),
+        "payments": _count_related(User, "payments"),
+        "unpaid_invoices": _count_related(User, "invoices", status__in=UNPAID_STATUSES),
+        "profile": Exists(TenantProfile.objects.filter(user=OuterRef("pk"))),
+    }
+    for accessor, _ in _summary_relations():
+        annotations[accessor] = _count_related(User, accessor)
+
+    return User.objects.filter(pk=user.pk).values("pk").annotate(**annotations).first() or {}
+
 
-    # Check for any payments (PROTECT)
-    if user.payments.exists():
-        return False
+def _related_queryset(model, accessor, **filters):
+    """Queryset for the reverse relation ``accessor``, correlated to the outer row."""
+    rel = model._meta.get_field(accessor)
+    return rel.related_model._default_manager.filter(
+        **{rel.field.name: OuterRef("pk")}, **filters
+    )
 
-    # Check for unpaid invoices
-    if user.invoices.filter(status__in=["pending", "issued", "overdue", "partial"]).exists():
-        return False
 
-    return True
+def _count_related(model, accessor, **filters):
+    """Build a ``COUNT(*)`` subquery for the reverse relation ``accessor``."""
+    rel = model._meta.get_field(accessor)
+    related = _related_queryset(model, accessor, **filters)
+    return Coalesce(
+        Subquery(
+            related.order_by().values(rel.field.name).annotate(n=Count("pk")).values("n"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
 
 
-def get_delete_blockers(user):
+def get_delete_blockers(user, counts=None):
     """
     Get a list of reasons preventing tenant deletion.
 
     Returns a list of human-readable strings explaining why
-    the tenant cannot be deleted.
+    the tenant cannot be deleted. Pass ``counts`` from
+    ``get_related_counts`` to avoid querying again.
     """
+    if counts is None:
+        counts = get_related_counts(user)
     blockers = []
 
     # Check leases
-    lease_count = user.leases.count()
+    lease_count = counts.get("leases", 0)
     if lease_count:
         blockers.append(f"{lease_count} lease{'s' if lease_count != 1 else ''} linked")
 
     # Check payments
-    payment_count = user.payments.count()
+    payment_count = counts.get("payments", 0)
     if payment_count:
         blockers.append(f"{payment_count} payment record{'s' if payment_count != 1 else ''}")
 
     # Check unpaid invoices
-    unpaid_count = user.invoices.filter(
-        status__in=["pending", "issued", "overdue", "partial"]
-    ).count()
+    unpaid_count = counts.get("unpaid_invoices", 0)
     if unpaid_count:
         blockers.append(f"{unpaid_count} unpaid invoice{'s' if unpaid_count != 1 else ''}")
 
     return blockers
 
 
-def get_delete_summary(user):
+def get_delete_summary(user, counts=None):
     """
     Get summary of what will be deleted when deleting a tenant.
 
     Returns a dict with counts of related records that will be removed.
+    Pass ``counts`` from ``get_related_counts`` to avoid querying again.
     """
+    if counts is None:
+        counts = get_related_counts(user)
     summary = {}
 
     # Profile
-    if hasattr(user, "tenant_profile"):
+    if counts.get("profile"):
         summary["profile"] = True
 
-    # Emergency contacts
-    if hasattr(user, "emergency_contacts"):
-        count = user.emergency_contacts.count()
+    for accessor, key in _summary_relations():
+        count = counts.get(accessor)
         if count:
-            summary["emergency_contacts"] = count
-
-    # Vehicles
-    if hasattr(user, "vehicles"):
-        count = user.vehicles.count()
-        if count:
-            summary["vehicles"] = count
-
-    # Employment records
-    if hasattr(user, "employments"):
-        count = user.employments.count()
-        if count:
-            summary["employment_records"] = count
-
-    # Insurance records
-    if hasattr(user, "insurance_policies"):
-        count = user.insurance_policies.count()
-        if count:
-            summary["insurance_policies"] = count
-
-    # ID verifications
-    if hasattr(user, "id_verifications"):
-        count = user.id_verifications.count()
-        if count:
-            summary["id_verifications"] = count
-
-    # Onboarding sessions
-    if hasattr(user, "onboarding_sessions"):
-        count = user.onboarding_sessions.count()
-        if count:
-            summary["onboarding_sessions"] = count
-
-    # OTP tokens
-    count = user.otp_tokens.count()
-    if count:
-        summary["otp_tokens"] = count
-
-    # Notifications
-    if hasattr(user, "notifications"):
-        count = user.notifications.count()
-        if count:
-            summary["notifications"] = count
+            summary[key] = count
 
     return summary
 
@@ -131,7 +199,7 @@ def delete_tenant(user, deleted_by=None):
     """
     Delete a tenant and clean up related data.
 
-    This function handles:
+    This function handles, in a single transaction:
     1. SET_NULL cleanup for documents (preserve document but null out tenant)
     2. User deletion (CASCADE handles most relations)
 
@@ -142,22 +210,20 @@ def delete_tenant(user, deleted_by=None):
     Returns:
         dict with deletion summary
     """
-    summary = get_delete_summary(user)
-
-    # Pre-delete cleanup for SET_NULL fields that should be explicitly nulled
-    # EDocuments - preserve the document but remove tenant reference
-    if hasattr(user, "edocuments_received"):
-        user.edocuments_received.update(tenant=None)
-
-    # Work orders - reported_by will be SET_NULL automatically
-    # Documents - tenant will be SET_NULL automatically
-    # Messages - sender will be SET_NULL automatically
+    User = get_user_model()
 
     # Store name before deletion
-    name = user.get_full_name() or user.email
+    name = f"{user.first_name} {user.last_name}".strip() or user.email
+
+    with transaction.atomic():
+        # Summarize inside the transaction so it matches what gets deleted
+        summary = get_delete_summary(user)
 
-    # Delete user (CASCADE handles most relations)
-    user.delete()
+        # Delete user (CASCADE handles most relations). The deletion collector
+        # nulls each SET_NULL relation (eDocuments, documents, work orders,
+        # messages, onboarding sessions) with one batched UPDATE per relation,
+        # so no per-relation pre-cleanup is needed.
+        User.objects.filter(pk=user.pk).delete()
 
     return {
         "name": name,
@@ -178,8 +244,8 @@ def archive_tenant(user):
     Args:
         user: The User instance to archive
     """
+    type(user).objects.filter(pk=user.pk).update(is_active=False)
     user.is_active = False
-    user.save(update_fields=["is_active"])
 
 
 def restore_tenant(user):
@@ -189,5 +255,5 @@ def restore_tenant(user):
     Args:
         user: The User instance to restore
     """
+    type(user).objects.filter(pk=user.pk).update(is_active=True)
     user.is_active = True
-    user.save(update_fields=["is_active"])
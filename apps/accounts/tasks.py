@@ -1,15 +1,29 @@
+"""
+OTP delivery tasks.
+
+Enqueue these with Django-Q2 rather than calling them inline, so SMTP/SMS
+provider latency stays off the login request, e.g.
+``async_task("apps.accounts.tasks.send_otp_email", email, code)``.
+
+``purge_expired_otp_tokens`` is meant to be scheduled daily via Django-Q2.
+"""
+
 import logging
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.core.services.email import send_email
+from apps.core.services.sms import sms_service
 
 logger = logging.getLogger(__name__)
 
 
 def send_otp_email(user_email, otp_code):
     """Django-Q2 task: Send OTP code via email."""
-    from apps.core.services.email import send_email
-
     send_email(
         subject="Your PropManager Verification Code",
-        message=f"Your verification code is: {otp_code}. It expires in 10 minutes.",
+        message=f"Your PropManager verification code is: {otp_code}. It expires in 10 minutes.",
         recipient_list=[user_email],
     )
     logger.info(f"OTP email sent to {user_email}")
@@ -17,10 +31,23 @@ def send_otp_email(user_email, otp_code):
 
 def send_otp_sms(phone_number, otp_code):
     """Django-Q2 task: Send OTP code via SMS."""
-    from apps.core.services.sms import sms_service
-
     sms_service.send_sms(
         to=phone_number,
         body=f"Your PropManager verification code is: {otp_code}. It expires in 10 minutes.",
     )
     logger.info(f"OTP SMS sent to {phone_number}")
+
+
+def purge_expired_otp_tokens(days=1):
+    """
+    Delete OTP tokens created more than ``days`` ago.
+
+    Tokens expire within minutes, so anything older is spent or dead. The
+    created_at range is served by the accounts_otptoken_created_brin index.
+    Intended to be scheduled as a daily task via Django-Q2.
+    """
+    from .models import OTPToken
+
+    cutoff = timezone.now() - timedelta(days=days)
+    count, _ = OTPToken.objects.filter(created_at__lt=cutoff).delete()
+    return f"Purged {count} expired OTP token(s)."
@@ -1,35 +1,80 @@
+import json
+import logging
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
-
-def is_admin_or_staff(user):
-    return user.is_authenticated and user.role in ("admin", "staff")
-
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Count, DecimalField, Exists, F, OuterRef, Q, Subquery, Sum, UUIDField
+from django.db.models.functions import Coalesce, Substr
 from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.http import require_POST
 
-from apps.core.decorators import admin_required, tenant_required
-
+from apps.ai.models import AICapability, AIProvider
+from apps.billing.models import ApiToken, Invoice, Payment, PaymentGatewayConfig
+from apps.communications.models import Announcement, Notification
+from apps.core.dashboard_data import CATEGORY_INFO, get_all_badge_counts, get_app_tiles
+from apps.core.dashboard_utils import (
+    get_aging_receivables,
+    get_lease_metrics,
+    get_payment_methods_chart_data,
+    get_period_comparison,
+    get_revenue_chart_data,
+    get_tenant_health_metrics,
+    get_workorder_charts_data,
+    get_workorder_metrics,
+)
+from apps.core.decorators import admin_required, login_rate_limit, tenant_required
+from apps.core.models import SystemSettings
+from apps.core.query_utils import scalar_subquery, sql_count, sql_sum
+from apps.leases.models import Lease
+from apps.notifications.models import EmailConfig, SMSConfig
+from apps.properties.models import Property, Unit
+from apps.rewards.models import RewardBalance, StreakEvaluation
+from apps.weather.models import WeatherAlert
+from apps.workorders.models import WorkOrder
+
+from . import tasks
 from .forms import AdminLoginForm, OTPVerifyForm, TenantLoginForm, TenantProfileForm
-from .models import OTPToken
+from .forms_settings import SystemSettingsForm
+from .models import OTPToken, TenantProfile
 from .services import (
+    annotate_can_delete,
     archive_tenant,
     can_delete_tenant,
     delete_tenant,
     get_delete_blockers,
     get_delete_summary,
+    get_related_counts,
     restore_tenant,
 )
 
+logger = logging.getLogger(__name__)
+
 User = get_user_model()
 
+# Signed cookies carrying the user awaiting OTP verification
+TENANT_OTP_COOKIE = "otp_pending"
+ADMIN_OTP_COOKIE = "admin_otp_pending"
+
+
+def is_admin_or_staff(user):
+    return user.is_authenticated and user.role in ("admin", "staff")
+
 
 # --- Tenant Passwordless Login ---
 
+@login_rate_limit
 def tenant_login(request):
     if request.user.is_authenticated and request.user.is_tenant:
         return redirect("accounts_tenant:tenant_dashboard")
@@ -38,24 +83,20 @@ def tenant_login(request):
     if request.method == "POST" and form.is_valid():
         identifier = form.cleaned_data["identifier"].strip()
 
-        user = User.objects.filter(
-            Q(email__iexact=identifier) | Q(phone_number=identifier),
-            role="tenant",
-            is_active=True,
-        ).first()
+        # An identifier is either an email or a phone number, never both, so
+        # each lookup can use its own index instead of an OR across both
+        if "@" in identifier:
+            lookup = {"email__iexact": identifier}
+        else:
+            lookup = {"phone_number": identifier}
+        user = User.objects.filter(role="tenant", is_active=True, **lookup).first()
 
         if not user:
             messages.error(request, "No account found with that email or phone number.")
             return render(request, "tenant/login.html", {"form": form})
 
-        # Rate limiting: check OTP requests in the last hour
-        one_hour_ago = timezone.now() - timezone.timedelta(hours=1)
-        recent_count = OTPToken.objects.filter(
-            user=user, created_at__gte=one_hour_ago
-        ).count()
-
-        from django.conf import settings
-        if recent_count >= settings.OTP_MAX_REQUESTS_PER_HOUR:
+        # Rate limiting: cap OTP requests per user per hour
+        if _otp_rate_limited(user):
             messages.error(request, "Too many verification requests. Please try again later.")
             return render(request, "tenant/login.html", {"form": form})
 
@@ -68,19 +109,19 @@ def tenant_login(request):
         otp = OTPToken.generate(user=user, purpose="login", delivery_method=delivery_method)
         _send_otp(otp, user)
 
-        request.session["otp_user_id"] = str(user.pk)
-        request.session["otp_delivery_method"] = delivery_method
-        return redirect("accounts_tenant:tenant_otp_verify")
+        response = redirect("accounts_tenant:tenant_otp_verify")
+        _set_otp_cookie(response, TENANT_OTP_COOKIE, user, delivery_method)
+        return response
 
     return render(request, "tenant/login.html", {"form": form})
 
 
+@login_rate_limit
 def tenant_otp_verify(request):
-    user_id = request.session.get("otp_user_id")
+    user_id, delivery_method = _read_otp_cookie(request, TENANT_OTP_COOKIE)
     if not user_id:
         return redirect("accounts_tenant:tenant_login")
 
-    delivery_method = request.session.get("otp_delivery_method", "email")
     form = OTPVerifyForm(request.POST or None)
 
     if request.method == "POST" and form.is_valid():
@@ -88,8 +129,6 @@ def tenant_otp_verify(request):
         user = authenticate(request, user_id=user_id, otp_code=code)
         if user:
             login(request, user, backend="apps.accounts.backends.PasswordlessOTPBackend")
-            request.session.pop("otp_user_id", None)
-            request.session.pop("otp_delivery_method", None)
             next_url = request.GET.get("next", "")
             # Validate redirect URL to prevent open redirect attacks
             if not next_url or not url_has_allowed_host_and_scheme(
@@ -97,7 +136,9 @@ def tenant_otp_verify(request):
             ):
                 next_url = "accounts_tenant:tenant_dashboard"
             messages.success(request, f"Welcome back, {user.get_full_name() or user.username}!")
-            return redirect(next_url)
+            response = redirect(next_url)
+            response.delete_cookie(TENANT_OTP_COOKIE)
+            return response
         else:
             messages.error(request, "Invalid or expired code. Please try again.")
 
@@ -109,91 +150,117 @@ def tenant_otp_verify(request):
 
 @tenant_required
 def tenant_dashboard(request):
-    from django.db.models import Sum
-    from apps.billing.models import Invoice
-    from apps.workorders.models import WorkOrder
-    from apps.communications.models import Message, Notification, Announcement
-    from apps.weather.models import WeatherAlert
-
-    # Balance
-    invoices_owed = Invoice.objects.filter(
-        tenant=request.user, status__in=["issued", "partial", "overdue"]
+    # Active leases, with unit/property for the address display; their
+    # properties scope weather alerts and announcements
+    active_leases = list(
+        Lease.objects.filter(tenant=request.user, status="active").select_related("unit__property")
     )
-    balance_due = invoices_owed.aggregate(
-        total=Sum("total_amount"), paid=Sum("amount_paid")
+    active_lease = next(iter(active_leases), None)
+    property_ids = {lease.unit.property_id for lease in active_leases}
+
+    # Balance, open work orders, unread messages and weather alerts are
+    # independent scalar subqueries, fetched together in one round trip
+    stat_queries = dict(
+        balance_due=scalar_subquery(
+            Invoice.objects.filter(
+                tenant=request.user, status__in=["issued", "partial", "overdue"]
+            ),
+            sql_sum("total_amount") - sql_sum("amount_paid"),
+            default=Decimal("0"),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        ),
+        open_wo_count=scalar_subquery(
+            WorkOrder.objects.filter(
+                reported_by=request.user
+            ).exclude(status__in=["completed", "closed"]),
+            sql_count(),
+        ),
+        unread_count=scalar_subquery(
+            Notification.objects.filter(recipient=request.user, is_read=False),
+            sql_count(),
+        ),
+    )
+    # Tenants without an active lease have no property to raise alerts for
+    if property_ids:
+        stat_queries["weather_alert_count"] = scalar_subquery(
+            WeatherAlert.objects.filter(
+                property_id__in=property_ids,
+                created_at__gte=timezone.now() - timezone.timedelta(days=7),
+            ),
+            sql_count(),
+        )
+    # Reward wallet and current streak are single-row lookups that ride
+    # along in the same query
+    stat_queries["rewards_balance"] = scalar_subquery(
+        RewardBalance.objects.filter(tenant=request.user),
+        F("balance"),
+        default=Decimal("0"),
+        output_field=DecimalField(max_digits=10, decimal_places=2),
     )
-    total = (balance_due["total"] or 0) - (balance_due["paid"] or 0)
-
-    # Work orders
-    open_wo_count = WorkOrder.objects.filter(
-        reported_by=request.user
-    ).exclude(status__in=["completed", "closed"]).count()
-
-    # Unread messages
-    unread_count = Notification.objects.filter(
-        recipient=request.user, is_read=False
-    ).count()
-
-    # Weather alerts (for properties where tenant has active lease)
-    from apps.leases.models import Lease
-    active_leases = Lease.objects.filter(tenant=request.user, status="active")
-    property_ids = active_leases.values_list("unit__property_id", flat=True)
-    weather_alert_count = WeatherAlert.objects.filter(
-        property_id__in=property_ids,
-        created_at__gte=timezone.now() - timezone.timedelta(days=7),
-    ).count()
-
-    # Get active lease with related unit/property for address display
-    active_lease = Lease.objects.filter(
-        tenant=request.user, status="active"
-    ).select_related("unit__property").first()
-
-    # Get rewards balance and streak
-    from apps.rewards.models import RewardBalance, StreakEvaluation
-    reward_balance = RewardBalance.objects.filter(tenant=request.user).first()
-    streak_info = None
     if active_lease:
-        streak_info = StreakEvaluation.objects.filter(
-            tenant=request.user,
-            config__property=active_lease.unit.property
-        ).first()
+        stat_queries["streak_months"] = scalar_subquery(
+            StreakEvaluation.objects.filter(
+                tenant=request.user,
+                config__property_id=active_lease.unit.property_id,
+            ),
+            F("current_streak_months"),
+        )
+    stats = User.objects.filter(pk=request.user.pk).values(**stat_queries).get()
 
     # Recent invoices and announcements
-    recent_invoices = Invoice.objects.filter(tenant=request.user).order_by("-issue_date")[:5]
-    announcements = Announcement.objects.filter(
-        is_published=True
-    ).filter(
-        Q(property__in=property_ids) | Q(property__isnull=True)
-    ).order_by("-published_at")[:5]
+    # Only the columns the dashboard cards render; announcement bodies are
+    # cut DB-side to a preview long enough for the 25-word excerpt
+    recent_invoices = (
+        Invoice.objects.filter(tenant=request.user)
+        .only("id", "invoice_number", "due_date", "total_amount", "status")
+        .order_by("-issue_date")[:5]
+    )
+    announcement_scope = Q(property__isnull=True)
+    if property_ids:
+        announcement_scope |= Q(property__in=property_ids)
+    announcements = (
+        Announcement.objects.filter(announcement_scope, is_published=True)
+        .only("id", "title", "published_at")
+        .annotate(preview=Substr("body", 1, 500))
+        .order_by("-published_at")[:5]
+    )
 
     return render(request, "tenant/dashboard.html", {
-        "balance_due": total,
-        "open_wo_count": open_wo_count,
-        "unread_count": unread_count,
-        "weather_alert_count": weather_alert_count,
+        "balance_due": stats["balance_due"],
+        "open_wo_count": stats["open_wo_count"],
+        "unread_count": stats["unread_count"],
+        "weather_alert_count": stats.get("weather_alert_count", 0),
         "recent_invoices": recent_invoices,
         "announcements": announcements,
         "active_lease": active_lease,
-        "reward_balance": reward_balance,
-        "streak_info": streak_info,
+        "reward_balance": stats["rewards_balance"],
+        "streak_months": stats.get("streak_months", 0),
     })
 
 
 @tenant_required
 def tenant_profile(request):
-    from .models import TenantProfile
     profile, _ = TenantProfile.objects.get_or_create(user=request.user)
 
     if request.method == "POST":
         form = TenantProfileForm(request.POST, instance=profile, user=request.user)
         if form.is_valid():
-            form.save()
-            # Update user fields
-            request.user.first_name = form.cleaned_data.get("first_name", request.user.first_name)
-            request.user.last_name = form.cleaned_data.get("last_name", request.user.last_name)
-            request.user.phone_number = form.cleaned_data.get("phone_number", request.user.phone_number)
-            request.user.preferred_contact = form.cleaned_data.get("preferred_contact", request.user.preferred_contact)
-            request.user.save(update_fields=["first_name", "last_name", "phone_number", "preferred_contact"])
+            # Only rows with changed values are written; resubmitting an
+            # unchanged form issues no UPDATEs at all
+            user_fields = {
+                field: form.cleaned_data[field]
+                for field in ("first_name", "last_name", "phone_number", "preferred_contact")
+                if form.cleaned_data[field] != getattr(request.user, field)
+            }
+            profile_changed = any(field in form.changed_data for field in form.Meta.fields)
+            # Profile and user rows are saved together or not at all
+            with transaction.atomic():
+                if profile_changed:
+                    form.save()
+                if user_fields:
+                    User.objects.filter(pk=request.user.pk).update(**user_fields)
+            for field, value in user_fields.items():
+                setattr(request.user, field, value)
             messages.success(request, "Profile updated successfully.")
             return redirect("accounts_tenant:tenant_profile")
     else:
@@ -204,6 +271,7 @@ def tenant_profile(request):
 
 # --- Admin Login with OTP ---
 
+@login_rate_limit
 def admin_login(request):
     if request.user.is_authenticated and request.user.is_admin_user:
         return redirect("accounts_admin:admin_dashboard")
@@ -218,13 +286,16 @@ def admin_login(request):
             # Check if OTP is required
             admin_profile = getattr(user, "admin_profile", None)
             if admin_profile and admin_profile.otp_enabled:
+                if _otp_rate_limited(user):
+                    messages.error(request, "Too many verification requests. Please try again later.")
+                    return render(request, "admin_portal/login.html", {"form": form})
                 otp = OTPToken.generate(
                     user=user, purpose="2fa", delivery_method=admin_profile.otp_delivery
                 )
                 _send_otp(otp, user)
-                request.session["admin_otp_user_id"] = str(user.pk)
-                request.session["admin_otp_delivery"] = admin_profile.otp_delivery
-                return redirect("accounts_admin:admin_otp_verify")
+                response = redirect("accounts_admin:admin_otp_verify")
+                _set_otp_cookie(response, ADMIN_OTP_COOKIE, user, admin_profile.otp_delivery)
+                return response
             else:
                 login(request, user)
                 messages.success(request, f"Welcome, {user.get_full_name() or user.username}!")
@@ -235,12 +306,12 @@ def admin_login(request):
     return render(request, "admin_portal/login.html", {"form": form})
 
 
+@login_rate_limit
 def admin_otp_verify(request):
-    user_id = request.session.get("admin_otp_user_id")
+    user_id, delivery_method = _read_otp_cookie(request, ADMIN_OTP_COOKIE)
     if not user_id:
         return redirect("accounts_admin:admin_login")
 
-    delivery_method = request.session.get("admin_otp_delivery", "email")
     form = OTPVerifyForm(request.POST or None)
 
     if request.method == "POST" and form.is_valid():
@@ -248,10 +319,10 @@ def admin_otp_verify(request):
         user = authenticate(request, user_id=user_id, otp_code=code)
         if user:
             login(request, user, backend="apps.accounts.backends.PasswordlessOTPBackend")
-            request.session.pop("admin_otp_user_id", None)
-            request.session.pop("admin_otp_delivery", None)
             messages.success(request, f"Welcome, {user.get_full_name() or user.username}!")
-            return redirect("accounts_admin:admin_dashboard")
+            response = redirect("accounts_admin:admin_dashboard")
+            response.delete_cookie(ADMIN_OTP_COOKIE)
+            return response
         else:
             messages.error(request, "Invalid or expired code. Please try again.")
 
@@ -266,55 +337,57 @@ def admin_dashboard(request):
     """
     Modern app launcher dashboard with mini KPIs and searchable app grid.
     """
-    from decimal import Decimal
-
-    from django.db.models import Sum
-    from django.db.models.functions import Coalesce
-
-    from apps.billing.models import Invoice, Payment
-    from apps.core.dashboard_data import CATEGORY_INFO, get_app_tiles
-    from apps.properties.models import Unit
-    from apps.workorders.models import WorkOrder
-
     today = timezone.now().date()
     month_start = today.replace(day=1)
 
-    # MINI KPIs (4 key metrics only)
-    # Revenue this month
-    month_revenue = Payment.objects.filter(
-        status="completed",
-        payment_date__date__gte=month_start,
-        payment_date__date__lte=today,
-    ).aggregate(total=Coalesce(Sum("amount"), Decimal("0")))["total"]
-
-    # Outstanding balance
-    outstanding = Invoice.objects.filter(
-        status__in=["issued", "partial", "overdue"]
-    ).aggregate(
-        total=Coalesce(Sum("total_amount"), Decimal("0")),
-        paid=Coalesce(Sum("amount_paid"), Decimal("0")),
-    )
-    outstanding_balance = outstanding["total"] - outstanding["paid"]
+    def compute_kpis():
+        # Revenue this month
+        month_revenue = Payment.objects.filter(
+            status="completed",
+            payment_date__date__gte=month_start,
+            payment_date__date__lte=today,
+        ).aggregate(total=Coalesce(Sum("amount"), Decimal("0")))["total"]
+
+        # Outstanding balance
+        outstanding_balance = Invoice.objects.filter(
+            status__in=["issued", "partial", "overdue"]
+        ).aggregate(
+            balance=Coalesce(Sum("total_amount"), Decimal("0"))
+            - Coalesce(Sum("amount_paid"), Decimal("0")),
+        )["balance"]
+
+        # Occupancy
+        units = Unit.objects.aggregate(
+            total=Count("pk"),
+            occupied=Count("pk", filter=Q(status="occupied")),
+        )
 
-    # Occupancy
-    total_units = Unit.objects.count()
-    occupied_units = Unit.objects.filter(status="occupied").count()
-    occupancy_rate = round((occupied_units / total_units * 100), 1) if total_units > 0 else 0
+        # Open work orders
+        work_orders = WorkOrder.objects.exclude(status__in=["completed", "closed"]).aggregate(
+            open=Count("pk"),
+            emergency=Count("pk", filter=Q(priority="emergency")),
+        )
 
-    # Open work orders
-    open_wo = WorkOrder.objects.exclude(status__in=["completed", "closed"]).count()
-    emergency_wo = (
-        WorkOrder.objects.filter(priority="emergency")
-        .exclude(status__in=["completed", "closed"])
-        .count()
-    )
+        return {
+            "month_revenue": month_revenue,
+            "outstanding_balance": outstanding_balance,
+            "total_units": units["total"],
+            "occupied_units": units["occupied"],
+            "open_wo": work_orders["open"],
+            "emergency_wo": work_orders["emergency"],
+        }
+
+    # MINI KPIs (4 key metrics only), cached briefly since they are global
+    kpis = cache.get_or_set(f"admin_kpis:v1:{today.isoformat()}", compute_kpis, timeout=60)
+    total_units = kpis["total_units"]
+    occupied_units = kpis["occupied_units"]
+    occupancy_rate = round((occupied_units / total_units * 100), 1) if total_units > 0 else 0
 
     # Get app tiles with badges
     app_tiles = get_app_tiles()
-
-    # Calculate badges for each tile
+    badges = get_all_badge_counts(request, app_tiles)
     for tile in app_tiles:
-        tile.badge_count = tile.get_badge_count(request)
+        tile.badge_count = badges.get(tile.id, 0)
 
     # Organize by category
     tiles_by_category = {}
@@ -333,13 +406,13 @@ def admin_dashboard(request):
         "admin_portal/dashboard_launcher.html",
         {
             # Mini KPIs
-            "month_revenue": month_revenue,
-            "outstanding_balance": outstanding_balance,
+            "month_revenue": kpis["month_revenue"],
+            "outstanding_balance": kpis["outstanding_balance"],
             "occupancy_rate": occupancy_rate,
             "occupied_units": occupied_units,
             "total_units": total_units,
-            "open_wo": open_wo,
-            "emergency_wo": emergency_wo,
+            "open_wo": kpis["open_wo"],
+            "emergency_wo": kpis["emergency_wo"],
             # App launcher data
             "app_tiles": app_tiles,
             "tiles_by_category": sorted_categories,
@@ -354,28 +427,6 @@ def admin_analytics_dashboard(request):
     Comprehensive SPLUNK-style analytics dashboard with time-framed metrics,
     trend analysis, charts, and actionable alerts.
     """
-    import json
-    from datetime import date, timedelta
-
-    from django.db.models import Sum
-    from django.urls import reverse
-
-    from apps.billing.models import Invoice, Payment
-    from apps.core.dashboard_utils import (
-        get_aging_receivables,
-        get_lease_metrics,
-        get_payment_methods_chart_data,
-        get_period_comparison,
-        get_revenue_chart_data,
-        get_tenant_health_metrics,
-        get_workorder_charts_data,
-        get_workorder_metrics,
-    )
-    from apps.leases.models import Lease
-    from apps.properties.models import Property, Unit
-    from apps.weather.models import WeatherAlert
-    from apps.workorders.models import WorkOrder
-
     # Time range handling
     range_param = request.GET.get("range", "30")
     property_filter = request.GET.get("property", "all")
@@ -409,38 +460,68 @@ def admin_analytics_dashboard(request):
         except ValueError:
             pass
 
-    # Gather all metrics
-    financial = get_period_comparison(start_date, end_date, property_ids)
-    workorders = get_workorder_metrics(start_date, end_date, property_ids)
-    leases = get_lease_metrics(property_ids)
-    tenant_health = get_tenant_health_metrics(start_date, end_date, property_ids)
-    aging = get_aging_receivables(property_ids)
-
-    # Chart data
-    revenue_chart = get_revenue_chart_data(start_date, end_date, property_ids)
-    wo_charts = get_workorder_charts_data(start_date, end_date, property_ids)
-    payment_methods_chart = get_payment_methods_chart_data(
-        tenant_health["method_breakdown"]
-    )
-
-    # Occupancy metrics
-    unit_filters = {}
-    if property_ids:
-        unit_filters["property_id__in"] = property_ids
+    def compute_metrics():
+        tenant_health = get_tenant_health_metrics(start_date, end_date, property_ids)
+        revenue_chart = get_revenue_chart_data(start_date, end_date, property_ids)
+        wo_charts = get_workorder_charts_data(start_date, end_date, property_ids)
+
+        # Occupancy metrics
+        unit_filters = {}
+        if property_ids:
+            unit_filters["property_id__in"] = property_ids
+        units = Unit.objects.filter(**unit_filters).aggregate(
+            total=Count("pk"),
+            occupied=Count("pk", filter=Q(status="occupied")),
+        )
 
-    total_units = Unit.objects.filter(**unit_filters).count() if unit_filters else Unit.objects.count()
-    occupied_units = Unit.objects.filter(status="occupied", **unit_filters).count() if unit_filters else Unit.objects.filter(status="occupied").count()
+        return {
+            "financial": get_period_comparison(start_date, end_date, property_ids),
+            "workorders": get_workorder_metrics(start_date, end_date, property_ids),
+            "leases": get_lease_metrics(property_ids),
+            "tenant_health": tenant_health,
+            "aging": get_aging_receivables(property_ids),
+            # Chart data, serialized once here so cache hits reuse the JSON
+            "revenue_chart_data": json.dumps(revenue_chart),
+            "wo_priority_chart_data": json.dumps(wo_charts["priority_chart"]),
+            "wo_category_chart_data": json.dumps(wo_charts["category_chart"]),
+            "payment_methods_chart_data": json.dumps(
+                get_payment_methods_chart_data(tenant_health["method_breakdown"])
+            ),
+            "total_units": units["total"],
+            "occupied_units": units["occupied"],
+        }
+
+    # Gather all metrics; analytics tolerate a minute of staleness
+    property_key = property_ids[0] if property_ids else "all"
+    metrics = cache.get_or_set(
+        f"analytics:v2:{range_param}:{property_key}:{today.isoformat()}",
+        compute_metrics,
+        timeout=60,
+    )
+    financial = metrics["financial"]
+    workorders = metrics["workorders"]
+    leases = metrics["leases"]
+    tenant_health = metrics["tenant_health"]
+    aging = metrics["aging"]
+
+    total_units = metrics["total_units"]
+    occupied_units = metrics["occupied_units"]
     occupancy_rate = round((occupied_units / total_units * 100), 1) if total_units > 0 else 0
 
-    # Recent activity
+    # Recent activity, fetching only the columns the activity feed renders
     recent_payments = (
         Payment.objects.filter(status="completed")
         .select_related("tenant", "invoice")
+        .only(
+            "amount", "payment_date", "tenant__username", "tenant__first_name",
+            "tenant__last_name", "invoice__invoice_number",
+        )
         .order_by("-payment_date")[:5]
     )
 
     recent_workorders = (
         WorkOrder.objects.select_related("unit", "unit__property")
+        .only("title", "status", "updated_at", "unit__unit_number", "unit__property__name")
         .order_by("-updated_at")[:5]
     )
 
@@ -491,6 +572,7 @@ def admin_analytics_dashboard(request):
             severity__in=["warning", "emergency"],
         )
         .select_related("property")
+        .only("title", "severity", "property__name")
         .order_by("-created_at")[:3]
     )
 
@@ -555,10 +637,10 @@ def admin_analytics_dashboard(request):
         "aging_buckets": aging,
         "aging_total": aging_total,
         # Charts (JSON for JavaScript)
-        "revenue_chart_data": json.dumps(revenue_chart),
-        "wo_priority_chart_data": json.dumps(wo_charts["priority_chart"]),
-        "wo_category_chart_data": json.dumps(wo_charts["category_chart"]),
-        "payment_methods_chart_data": json.dumps(payment_methods_chart),
+        "revenue_chart_data": metrics["revenue_chart_data"],
+        "wo_priority_chart_data": metrics["wo_priority_chart_data"],
+        "wo_category_chart_data": metrics["wo_category_chart_data"],
+        "payment_methods_chart_data": metrics["payment_methods_chart_data"],
         # Activity & Alerts
         "recent_payments": recent_payments,
         "recent_workorders": recent_workorders,
@@ -574,7 +656,11 @@ def admin_analytics_dashboard(request):
 @admin_required
 def admin_tenant_list(request):
     """List all tenant accounts with search, status tabs, and filter."""
-    tenants = User.objects.filter(role="tenant").order_by("last_name", "first_name")
+    tenants = (
+        User.objects.filter(role="tenant")
+        .only("pk", "username", "first_name", "last_name", "email", "phone_number", "is_active", "role")
+        .order_by("last_name", "first_name")
+    )
 
     # Status filter: active (default), archived, all
     status_filter = request.GET.get("status", "active")
@@ -595,81 +681,64 @@ def admin_tenant_list(request):
         )
 
     # Annotate with active lease info
-    from apps.leases.models import Lease
-
-    active_lease_map = {}
-    active_leases = Lease.objects.filter(
-        status="active", tenant__in=tenants
-    ).select_related("unit", "unit__property")
-    for lease in active_leases:
-        active_lease_map[lease.tenant_id] = lease
-
-    tenant_data = []
-    for tenant in tenants:
-        tenant_data.append({
-            "user": tenant,
-            "active_lease": active_lease_map.get(tenant.pk),
-            "can_delete": can_delete_tenant(tenant),
-        })
+    active_lease = Lease.objects.filter(tenant=OuterRef("pk"), status="active")
+    tenants = annotate_can_delete(tenants).annotate(
+        active_unit_pk=Subquery(active_lease.values("unit_id")[:1], output_field=UUIDField()),
+        active_unit_number=Subquery(active_lease.values("unit__unit_number")[:1]),
+        active_property_pk=Subquery(active_lease.values("unit__property_id")[:1], output_field=UUIDField()),
+        active_property_name=Subquery(active_lease.values("unit__property__name")[:1]),
+    )
+
+    page = Paginator(tenants, 50).get_page(request.GET.get("page"))
 
     # Counts for tabs
-    active_count = User.objects.filter(role="tenant", is_active=True).count()
-    archived_count = User.objects.filter(role="tenant", is_active=False).count()
+    counts = User.objects.filter(role="tenant").aggregate(
+        active=Count("pk", filter=Q(is_active=True)),
+        archived=Count("pk", filter=Q(is_active=False)),
+    )
 
     return render(request, "admin_portal/tenant_list.html", {
-        "tenant_data": tenant_data,
+        "tenants": page.object_list,
+        "page_obj": page,
         "search": search,
         "status_filter": status_filter,
-        "total_count": len(tenant_data),
-        "active_count": active_count,
-        "archived_count": archived_count,
+        "total_count": page.paginator.count,
+        "active_count": counts["active"],
+        "archived_count": counts["archived"],
     })
 
 
 @admin_required
 def admin_tenant_detail_modal(request, pk):
     """Return tenant detail content for modal (AJAX)."""
-    tenant = get_object_or_404(User, pk=pk, role="tenant")
+    tenant = get_object_or_404(User.objects.select_related("tenant_profile"), pk=pk, role="tenant")
+
+    # Per-relation counts drive the delete checks and let empty relations skip their query
+    related_counts = get_related_counts(tenant)
+    delete_blockers = get_delete_blockers(tenant, counts=related_counts)
 
     # Gather all related data
-    from apps.leases.models import Lease
+    leases = []
+    if related_counts.get("leases"):
+        leases = list(
+            Lease.objects.filter(tenant=tenant)
+            .select_related("unit", "unit__property")
+            .order_by("-start_date")
+        )
+    active_lease = next((lease for lease in leases if lease.status in ("active", "renewed")), None)
 
-    leases = Lease.objects.filter(tenant=tenant).select_related(
+    invoices = tenant.invoices.order_by("-created_at")[:10]
+    payments = tenant.payments.order_by("-created_at")[:10] if related_counts.get("payments") else []
+    work_orders = tenant.reported_work_orders.select_related(
         "unit", "unit__property"
-    ).order_by("-start_date")
-    active_lease = leases.filter(status__in=["active", "renewed"]).first()
-
-    # Invoices and payments
-    invoices = []
-    payments = []
-    if hasattr(tenant, "invoices"):
-        invoices = tenant.invoices.order_by("-created_at")[:10]
-    if hasattr(tenant, "payments"):
-        payments = tenant.payments.order_by("-created_at")[:10]
-
-    # Work orders
-    work_orders = []
-    if hasattr(tenant, "reported_work_orders"):
-        work_orders = tenant.reported_work_orders.select_related(
-            "unit", "unit__property"
-        ).order_by("-created_at")[:5]
-
-    # Onboarding sessions
+    ).order_by("-created_at")[:5]
     onboarding_sessions = []
-    if hasattr(tenant, "onboarding_sessions"):
+    if related_counts.get("onboarding_sessions"):
         onboarding_sessions = tenant.onboarding_sessions.select_related(
             "unit", "template"
         ).order_by("-created_at")
-
-    # Emergency contacts
-    emergency_contacts = []
-    if hasattr(tenant, "emergency_contacts"):
-        emergency_contacts = tenant.emergency_contacts.all()
-
-    # Vehicles
-    vehicles = []
-    if hasattr(tenant, "vehicles"):
-        vehicles = tenant.vehicles.all()
+    emergency_contacts = tenant.emergency_contacts.all() if related_counts.get("emergency_contacts") else []
+    vehicles = tenant.vehicles.all() if related_counts.get("vehicles") else []
 
     context = {
         "tenant": tenant,
@@ -682,10 +751,10 @@ def admin_tenant_detail_modal(request, pk):
         "onboarding_sessions": onboarding_sessions,
         "emergency_contacts": emergency_contacts,
         "vehicles": vehicles,
-        # Deletion eligibility
-        "can_delete": can_delete_tenant(tenant),
-        "delete_blockers": get_delete_blockers(tenant),
-        "delete_summary": get_delete_summary(tenant),
+        # Deletion eligibility (blockers mirror can_delete_tenant's checks)
+        "can_delete": not delete_blockers,
+        "delete_blockers": delete_blockers,
+        "delete_summary": get_delete_summary(tenant, counts=related_counts),
     }
     return render(request, "admin_portal/_tenant_detail_modal.html", context)
 
@@ -743,31 +812,26 @@ def admin_tenant_restore(request, pk):
 @admin_required
 def admin_settings(request):
     """Admin settings overview page."""
-    from apps.ai.models import AICapability, AIProvider
-    from apps.billing.models import ApiToken, PaymentGatewayConfig
-    from apps.notifications.models import EmailConfig, SMSConfig
-
-    gateway_count = PaymentGatewayConfig.objects.count()
-    active_gateways = PaymentGatewayConfig.objects.filter(is_active=True).count()
-    api_token_count = ApiToken.objects.filter(is_active=True).count()
-    staff_count = User.objects.filter(role__in=("admin", "staff"), is_active=True).count()
-    email_active = EmailConfig.objects.filter(is_active=True).exists()
-    sms_active = SMSConfig.objects.filter(is_active=True).exists()
-    ai_provider_count = AIProvider.objects.count()
-    ai_active_providers = AIProvider.objects.filter(is_active=True).count()
-    ai_capabilities_enabled = AICapability.objects.filter(is_enabled=True).count()
-
-    return render(request, "admin_portal/settings.html", {
-        "gateway_count": gateway_count,
-        "active_gateways": active_gateways,
-        "api_token_count": api_token_count,
-        "staff_count": staff_count,
-        "email_active": email_active,
-        "sms_active": sms_active,
-        "ai_provider_count": ai_provider_count,
-        "ai_active_providers": ai_active_providers,
-        "ai_capabilities_enabled": ai_capabilities_enabled,
-    })
+    # All overview counts in one round trip, selected alongside the current user
+    counts = User.objects.filter(pk=request.user.pk).values(
+        gateway_count=scalar_subquery(PaymentGatewayConfig.objects.all(), sql_count()),
+        active_gateways=scalar_subquery(
+            PaymentGatewayConfig.objects.filter(is_active=True), sql_count()
+        ),
+        api_token_count=scalar_subquery(ApiToken.objects.filter(is_active=True), sql_count()),
+        staff_count=scalar_subquery(
+            User.objects.filter(role__in=("admin", "staff"), is_active=True), sql_count()
+        ),
+        email_active=Exists(EmailConfig.objects.filter(is_active=True)),
+        sms_active=Exists(SMSConfig.objects.filter(is_active=True)),
+        ai_provider_count=scalar_subquery(AIProvider.objects.all(), sql_count()),
+        ai_active_providers=scalar_subquery(AIProvider.objects.filter(is_active=True), sql_count()),
+        ai_capabilities_enabled=scalar_subquery(
+            AICapability.objects.filter(is_enabled=True), sql_count()
+        ),
+    ).get()
+
+    return render(request, "admin_portal/settings.html", counts)
 
 
 # --- Shared ---
@@ -783,28 +847,68 @@ def user_logout(request):
 
 # --- Helpers ---
 
+def _set_otp_cookie(response, name, user, delivery_method):
+    """Remember who is verifying an OTP in a signed cookie rather than the session."""
+    response.set_signed_cookie(
+        name,
+        f"{user.pk}:{delivery_method}",
+        salt=name,
+        max_age=settings.OTP_EXPIRY_MINUTES * 60,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+def _read_otp_cookie(request, name):
+    """Return (user_id, delivery_method) from a valid OTP cookie, else (None, None)."""
+    value = request.get_signed_cookie(
+        name, default=None, salt=name, max_age=settings.OTP_EXPIRY_MINUTES * 60
+    )
+    if not value:
+        return None, None
+    user_id, _, delivery_method = value.partition(":")
+    return user_id, delivery_method or "email"
+
+
+def _otp_rate_limited(user):
+    """Count an OTP request against the user's hourly window; True once over the limit."""
+    key = f"otp_rpm:{user.pk}:{int(time.time() // 3600)}"
+    cache.add(key, 0, 3600)
+    try:
+        count = cache.incr(key)
+    except ValueError:
+        # Key expired between add() and incr()
+        cache.set(key, 1, 3600)
+        count = 1
+    return count > settings.OTP_MAX_REQUESTS_PER_HOUR
+
+
 def _send_otp(otp, user):
-    """Send OTP via the configured delivery method."""
-    message = f"Your PropManager verification code is: {otp.code}. It expires in 10 minutes."
+    """Queue OTP delivery via the configured delivery method."""
     if otp.delivery_method == "sms" and user.phone_number:
-        from apps.core.services.sms import sms_service
-        sms_service.send_sms(to=user.phone_number, body=message)
+        task, recipient = "send_otp_sms", user.phone_number
     else:
-        from apps.core.services.email import send_email
-        send_email(
-            subject="Your PropManager Verification Code",
-            message=message,
-            recipient_list=[user.email],
+        task, recipient = "send_otp_email", user.email
+
+    try:
+        from django_q.tasks import async_task
+
+        # save=False keeps the plaintext code out of the stored task results
+        async_task(
+            f"apps.accounts.tasks.{task}", recipient, otp.code,
+            task_name=f"otp-{otp.pk}", save=False,
         )
+    except Exception:
+        # Fallback: deliver synchronously if Q cluster is not running
+        logger.warning("Django-Q2 unavailable — sending OTP %s synchronously.", otp.pk)
+        getattr(tasks, task)(recipient, otp.code)
 
 
 @login_required
 @user_passes_test(is_admin_or_staff)
 def admin_system_settings(request):
     """System-wide settings (API keys, integrations, etc.)."""
-    from apps.core.models import SystemSettings
-    from apps.accounts.forms_settings import SystemSettingsForm
-    
     settings = SystemSettings.get_settings()
     
     if request.method == "POST":
@@ -6,6 +6,27 @@ from django import forms
 
 from .models import AIProvider
 
+OPENAI_MODELS = (
+    ("gpt-4o", "GPT-4o (Latest)"),
+    ("gpt-4-turbo", "GPT-4 Turbo"),
+    ("gpt-4", "GPT-4"),
+    ("gpt-3.5-turbo", "GPT-3.5 Turbo"),
+)
+
+ANTHROPIC_MODELS = (
+    ("claude-sonnet-4-20250514", "Claude Sonnet 4 (Latest)"),
+    ("claude-3-5-sonnet-20241022", "Claude 3.5 Sonnet"),
+    ("claude-3-opus-20240229", "Claude 3 Opus"),
+    ("claude-3-haiku-20240307", "Claude 3 Haiku"),
+)
+
+GEMINI_MODELS = (
+    ("gemini-2.0-flash", "Gemini 2.0 Flash (Latest)"),
+    ("gemini-1.5-pro", "Gemini 1.5 Pro"),
+    ("gemini-1.5-flash", "Gemini 1.5 Flash"),
+    ("gemini-pro", "Gemini Pro"),
+)
+
 
 class AIProviderBaseForm(forms.ModelForm):
     """Base form for AI provider configuration."""
@@ -19,6 +40,15 @@ class AIProviderBaseForm(forms.ModelForm):
             "is_default": forms.CheckboxInput(attrs={"class": "form-check-input"}),
         }
 
+    # Provider config keys shown as form fields, with their fallback values
+    config_defaults = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance and self.instance.config:
+            for key, default in self.config_defaults.items():
+                self.initial.setdefault(key, self.instance.config.get(key, default))
+
 
 class OpenAIForm(AIProviderBaseForm):
     """Form for OpenAI provider configuration."""
@@ -32,21 +62,12 @@ class OpenAIForm(AIProviderBaseForm):
         help_text="Your OpenAI API key (starts with sk-)",
     )
     model = forms.ChoiceField(
-        choices=[
-            ("gpt-4o", "GPT-4o (Latest)"),
-            ("gpt-4-turbo", "GPT-4 Turbo"),
-            ("gpt-4", "GPT-4"),
-            ("gpt-3.5-turbo", "GPT-3.5 Turbo"),
-        ],
+        choices=OPENAI_MODELS,
         initial="gpt-4o",
         widget=forms.Select(attrs={"class": "form-select"}),
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.config:
-            self.fields["api_key"].initial = self.instance.config.get("api_key", "")
-            self.fields["model"].initial = self.instance.config.get("model", "gpt-4o")
+    config_defaults = {"api_key": "", "model": "gpt-4o"}
 
     def save(self, commit=True):
         instance = super().save(commit=False)
@@ -72,23 +93,12 @@ class AnthropicForm(AIProviderBaseForm):
         help_text="Your Anthropic API key",
     )
     model = forms.ChoiceField(
-        choices=[
-            ("claude-sonnet-4-20250514", "Claude Sonnet 4 (Latest)"),
-            ("claude-3-5-sonnet-20241022", "Claude 3.5 Sonnet"),
-            ("claude-3-opus-20240229", "Claude 3 Opus"),
-            ("claude-3-haiku-20240307", "Claude 3 Haiku"),
-        ],
+        choices=ANTHROPIC_MODELS,
         initial="claude-sonnet-4-20250514",
         widget=forms.Select(attrs={"class": "form-select"}),
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.config:
-            self.fields["api_key"].initial = self.instance.config.get("api_key", "")
-            self.fields["model"].initial = self.instance.config.get(
-                "model", "claude-sonnet-4-20250514"
-            )
+    config_defaults = {"api_key": "", "model": "claude-sonnet-4-20250514"}
 
     def save(self, commit=True):
         instance = super().save(commit=False)
@@ -114,23 +124,12 @@ class GeminiForm(AIProviderBaseForm):
         help_text="Your Google AI API key",
     )
     model = forms.ChoiceField(
-        choices=[
-            ("gemini-2.0-flash", "Gemini 2.0 Flash (Latest)"),
-            ("gemini-1.5-pro", "Gemini 1.5 Pro"),
-            ("gemini-1.5-flash", "Gemini 1.5 Flash"),
-            ("gemini-pro", "Gemini Pro"),
-        ],
+        choices=GEMINI_MODELS,
         initial="gemini-2.0-flash",
         widget=forms.Select(attrs={"class": "form-select"}),
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.config:
-            self.fields["api_key"].initial = self.instance.config.get("api_key", "")
-            self.fields["model"].initial = self.instance.config.get(
-                "model", "gemini-2.0-flash"
-            )
+    config_defaults = {"api_key": "", "model": "gemini-2.0-flash"}
 
     def save(self, commit=True):
         instance = super().save(commit=False)
@@ -166,16 +165,11 @@ class LocalAIForm(AIProviderBaseForm):
         help_text="Model name configured in LocalAI",
     )
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.config:
-            self.fields["base_url"].initial = self.instance.config.get(
-                "base_url", "http://localhost:8080"
-            )
-            self.fields["api_key"].initial = self.instance.config.get("api_key", "")
-            self.fields["model"].initial = self.instance.config.get(
-                "model", "gpt-3.5-turbo"
-            )
+    config_defaults = {
+        "base_url": "http://localhost:8080",
+        "api_key": "",
+        "model": "gpt-3.5-turbo",
+    }
 
     def save(self, commit=True):
         instance = super().save(commit=False)
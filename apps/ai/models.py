@@ -2,7 +2,7 @@
 AI Gateway models for provider configuration and capabilities.
 """
 
-from django.db import models
+from django.db import models, transaction
 
 from apps.core.models import TimeStampedModel
 
@@ -49,6 +49,13 @@ class AIProvider(TimeStampedModel):
         ordering = ["-is_default", "-is_active", "name"]
         verbose_name = "AI Provider"
         verbose_name_plural = "AI Providers"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_default"],
+                condition=models.Q(is_default=True, is_active=True),
+                name="ai_single_active_default_provider",
+            ),
+        ]
 
     def __str__(self):
         status = "Active" if self.is_active else "Inactive"
@@ -56,12 +63,17 @@ class AIProvider(TimeStampedModel):
         return f"{self.name} - {self.get_provider_display()} [{status}]{default}"
 
     def save(self, *args, **kwargs):
-        # Ensure only one default provider exists
+        # Ensure only one default provider exists; clearing the previous
+        # default and saving happen together, and
+        # ai_single_active_default_provider rejects a concurrent second default
         if self.is_default and self.is_active:
-            AIProvider.objects.filter(is_default=True).exclude(pk=self.pk).update(
-                is_default=False
-            )
-        super().save(*args, **kwargs)
+            with transaction.atomic():
+                AIProvider.objects.filter(is_default=True).exclude(pk=self.pk).update(
+                    is_default=False
+                )
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
 
     @property
     def model_name(self):
@@ -2,6 +2,9 @@
 AI Gateway admin views for provider and capability management.
 """
 
+from functools import lru_cache
+
+import requests
 from django.contrib import messages
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
@@ -12,23 +15,29 @@ from apps.core.decorators import admin_required
 from .forms import PROVIDER_FORM_MAP, PROVIDER_INFO
 from .models import AICapability, AIProvider
 
+# Shared session so repeated LocalAI connection tests reuse pooled
+# keep-alive connections instead of a new TCP (and TLS) handshake each time
+_http = requests.Session()
+
 
 @admin_required
 def admin_dashboard(request):
     """Main AI Gateway dashboard showing providers and capabilities."""
-    providers = AIProvider.objects.all()
-
-    # Build provider cards with configured status
+    # One query for every configured provider; the first row per type (in
+    # default ordering) backs its card, and the counts come from the same list
+    providers = list(AIProvider.objects.all())
+    providers_by_key = {}
+    for provider_obj in providers:
+        providers_by_key.setdefault(provider_obj.provider, provider_obj)
+
+    # Build provider cards: static PROVIDER_INFO fields plus configured status
     provider_cards = []
     for provider_key, info in PROVIDER_INFO.items():
-        configured = providers.filter(provider=provider_key).first()
+        configured = providers_by_key.get(provider_key)
         provider_cards.append(
             {
                 "key": provider_key,
-                "name": info["name"],
-                "icon": info["icon"],
-                "description": info["description"],
-                "color": info["color"],
+                **info,
                 "configured": configured,
                 "is_active": configured.is_active if configured else False,
                 "is_default": configured.is_default if configured else False,
@@ -36,20 +45,25 @@ def admin_dashboard(request):
             }
         )
 
-    # Get or create capabilities
-    capabilities = []
-    for cap_key, cap_name in AICapability.CAPABILITY_CHOICES:
-        cap, _ = AICapability.objects.get_or_create(
-            capability=cap_key,
-            defaults={"is_enabled": False},
-        )
-        capabilities.append(cap)
+    # Get or create capabilities: one SELECT, plus one INSERT for any missing
+    # rows on first visit (ignore_conflicts covers a concurrent first visit)
+    capability_keys = [cap_key for cap_key, _ in AICapability.CAPABILITY_CHOICES]
+    existing = {cap.capability: cap for cap in AICapability.objects.filter(capability__in=capability_keys)}
+    missing = [
+        AICapability(capability=cap_key, is_enabled=False)
+        for cap_key in capability_keys
+        if cap_key not in existing
+    ]
+    if missing:
+        AICapability.objects.bulk_create(missing, ignore_conflicts=True)
+        existing = {cap.capability: cap for cap in AICapability.objects.filter(capability__in=capability_keys)}
+    capabilities = [existing[cap_key] for cap_key in capability_keys]
 
     context = {
         "provider_cards": provider_cards,
         "capabilities": capabilities,
-        "active_providers": providers.filter(is_active=True).count(),
-        "total_providers": providers.count(),
+        "active_providers": sum(1 for provider_obj in providers if provider_obj.is_active),
+        "total_providers": len(providers),
     }
     return render(request, "ai/admin_dashboard.html", context)
 
@@ -68,11 +82,11 @@ def admin_provider_create(request, provider=None):
         messages.error(request, f"Unknown provider type: {provider}")
         return redirect("ai_admin:dashboard")
 
-    # Check if provider already exists
-    existing = AIProvider.objects.filter(provider=provider).first()
-    if existing:
+    # Check if provider already exists; only the pk is needed for the redirect
+    existing_pk = AIProvider.objects.filter(provider=provider).values_list("pk", flat=True).first()
+    if existing_pk:
         messages.info(request, f"{PROVIDER_INFO[provider]['name']} is already configured. Editing existing configuration.")
-        return redirect("ai_admin:provider_edit", pk=existing.pk)
+        return redirect("ai_admin:provider_edit", pk=existing_pk)
 
     FormClass = PROVIDER_FORM_MAP[provider]
     provider_info = PROVIDER_INFO[provider]
@@ -158,15 +172,34 @@ def admin_provider_test(request, pk):
         return JsonResponse({"success": False, "message": str(e)})
 
 
+# Connection tests run on a gunicorn request thread, so probes are capped
+# rather than inheriting the SDK defaults (10 minute timeout, 2 retries)
+PROBE_TIMEOUT = 10
+
+
+# SDK clients are cached per API key, so an edited key simply gets a new
+# client while repeated tests reuse a client with a warm connection pool
+@lru_cache(maxsize=8)
+def _openai_client(api_key):
+    import openai
+
+    return openai.OpenAI(api_key=api_key, timeout=PROBE_TIMEOUT, max_retries=0)
+
+
+@lru_cache(maxsize=8)
+def _anthropic_client(api_key):
+    import anthropic
+
+    return anthropic.Anthropic(api_key=api_key, timeout=PROBE_TIMEOUT, max_retries=0)
+
+
 def _test_provider_connection(provider: AIProvider) -> tuple[bool, str]:
     """Test connection to a provider. Returns (success, message)."""
     config = provider.config
 
     if provider.provider == "openai":
         try:
-            import openai
-
-            client = openai.OpenAI(api_key=config.get("api_key"))
+            client = _openai_client(config.get("api_key"))
             # List models to verify connection
             client.models.list()
             return True, "Connection successful"
@@ -177,15 +210,9 @@ def _test_provider_connection(provider: AIProvider) -> tuple[bool, str]:
 
     elif provider.provider == "anthropic":
         try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=config.get("api_key"))
-            # Simple test request
-            client.messages.create(
-                model=config.get("model", "claude-3-haiku-20240307"),
-                max_tokens=10,
-                messages=[{"role": "user", "content": "Hi"}],
-            )
+            client = _anthropic_client(config.get("api_key"))
+            # Listing one model proves the key without a billable completion
+            client.models.list(limit=1)
             return True, "Connection successful"
         except ImportError:
             return False, "Anthropic library not installed"
@@ -197,8 +224,8 @@ def _test_provider_connection(provider: AIProvider) -> tuple[bool, str]:
             import google.generativeai as genai
 
             genai.configure(api_key=config.get("api_key"))
-            model = genai.GenerativeModel(config.get("model", "gemini-pro"))
-            model.generate_content("Hi")
+            # list_models() is lazy; pulling the first page makes the request
+            next(iter(genai.list_models(page_size=1, request_options={"timeout": PROBE_TIMEOUT})), None)
             return True, "Connection successful"
         except ImportError:
             return False, "Google Generative AI library not installed"
@@ -207,18 +234,15 @@ def _test_provider_connection(provider: AIProvider) -> tuple[bool, str]:
 
     elif provider.provider == "localai":
         try:
-            import requests
-
             base_url = config.get("base_url", "http://localhost:8080")
             headers = {}
             if config.get("api_key"):
                 headers["Authorization"] = f"Bearer {config['api_key']}"
 
-            response = requests.get(f"{base_url}/v1/models", headers=headers, timeout=10)
+            # (connect, read) timeouts: fail fast on an unreachable host
+            response = _http.get(f"{base_url}/v1/models", headers=headers, timeout=(3, PROBE_TIMEOUT))
             response.raise_for_status()
             return True, "Connection successful"
-        except ImportError:
-            return False, "Requests library not installed"
         except Exception as e:
             return False, str(e)
 
@@ -29,6 +29,7 @@ class PaymentGatewayConfigAdmin(admin.ModelAdmin):
 @admin.register(BillingCycle)
 class BillingCycleAdmin(admin.ModelAdmin):
     list_display = ("name", "property", "start_date", "end_date", "is_closed")
+    list_select_related = ("property",)
     list_filter = ("is_closed",)
 
 
@@ -40,6 +41,9 @@ class InvoiceLineItemInline(admin.TabularInline):
 @admin.register(Invoice)
 class InvoiceAdmin(admin.ModelAdmin):
     list_display = ("invoice_number", "tenant", "status", "total_amount", "amount_paid", "late_fees_total", "due_date")
+    list_select_related = ("tenant",)
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ("status",)
     search_fields = ("invoice_number", "tenant__username", "tenant__email")
     inlines = [InvoiceLineItemInline]
@@ -48,6 +52,9 @@ class InvoiceAdmin(admin.ModelAdmin):
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
     list_display = ("tenant", "invoice", "amount", "method", "status", "credit_applied", "payment_date")
+    list_select_related = ("tenant", "invoice__tenant")
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ("status", "method")
     search_fields = ("tenant__username", "reference_number")
 
@@ -55,11 +62,13 @@ class PaymentAdmin(admin.ModelAdmin):
 @admin.register(PrepaymentCredit)
 class PrepaymentCreditAdmin(admin.ModelAdmin):
     list_display = ("tenant", "amount", "remaining_amount", "reason")
+    list_select_related = ("tenant",)
 
 
 @admin.register(UtilityConfig)
 class UtilityConfigAdmin(admin.ModelAdmin):
     list_display = ("unit", "utility_type", "billing_mode", "rate", "is_active")
+    list_select_related = ("unit__property",)
     list_filter = ("utility_type", "billing_mode", "is_active")
     search_fields = ("unit__unit_number", "unit__property__name")
 
@@ -67,6 +76,9 @@ class UtilityConfigAdmin(admin.ModelAdmin):
 @admin.register(UtilityRateLog)
 class UtilityRateLogAdmin(admin.ModelAdmin):
     list_display = ("utility_config", "previous_rate", "new_rate", "previous_billing_mode", "new_billing_mode", "source", "created_at")
+    list_select_related = ("utility_config__unit__property",)
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ("source", "new_billing_mode")
     search_fields = ("utility_config__unit__unit_number",)
     readonly_fields = ("utility_config", "previous_rate", "new_rate", "previous_billing_mode", "new_billing_mode", "changed_by", "source", "notes")
@@ -75,6 +87,7 @@ class UtilityRateLogAdmin(admin.ModelAdmin):
 @admin.register(ApiToken)
 class ApiTokenAdmin(admin.ModelAdmin):
     list_display = ("label", "user", "is_active", "last_used_at", "created_at")
+    list_select_related = ("user",)
     list_filter = ("is_active",)
     search_fields = ("label", "user__username")
 
@@ -82,12 +95,16 @@ class ApiTokenAdmin(admin.ModelAdmin):
 @admin.register(PropertyBillingConfig)
 class PropertyBillingConfigAdmin(admin.ModelAdmin):
     list_display = ("property", "auto_generate_invoices", "late_fee_enabled", "grace_period_days", "late_fee_type", "late_fee_amount")
+    list_select_related = ("property",)
     list_filter = ("auto_generate_invoices", "late_fee_enabled")
 
 
 @admin.register(RecurringCharge)
 class RecurringChargeAdmin(admin.ModelAdmin):
     list_display = ("description", "charge_type", "amount", "frequency", "lease", "property", "is_active")
+    list_select_related = ("lease__tenant", "lease__unit__property", "property")
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ("charge_type", "frequency", "is_active")
     search_fields = ("description",)
 
@@ -95,6 +112,7 @@ class RecurringChargeAdmin(admin.ModelAdmin):
 @admin.register(LateFeeLog)
 class LateFeeLogAdmin(admin.ModelAdmin):
     list_display = ("invoice", "fee_type", "amount", "applied_date")
+    list_select_related = ("invoice__tenant",)
     list_filter = ("fee_type",)
     readonly_fields = ("invoice", "line_item", "fee_type", "amount", "applied_date", "notes")
 
@@ -102,6 +120,9 @@ class LateFeeLogAdmin(admin.ModelAdmin):
 @admin.register(WebhookEvent)
 class WebhookEventAdmin(admin.ModelAdmin):
     list_display = ("provider", "event_type", "status", "payment", "ip_address", "created_at")
+    list_select_related = ("payment__tenant",)
+    list_per_page = 50
+    show_full_result_count = False
     list_filter = ("provider", "status")
     search_fields = ("event_type", "event_id")
     readonly_fields = ("provider", "event_type", "event_id", "payload", "status", "payment", "error_message", "ip_address")
@@ -110,12 +131,14 @@ class WebhookEventAdmin(admin.ModelAdmin):
 @admin.register(BitcoinWalletConfig)
 class BitcoinWalletConfigAdmin(admin.ModelAdmin):
     list_display = ("payment_gateway_config", "network", "next_index", "created_at")
+    list_select_related = ("payment_gateway_config",)
     list_filter = ("network",)
 
 
 @admin.register(BitcoinPayment)
 class BitcoinPaymentAdmin(admin.ModelAdmin):
     list_display = ("btc_address", "invoice", "status", "usd_amount", "expected_satoshis", "received_satoshis", "confirmations", "created_at")
+    list_select_related = ("invoice__tenant",)
     list_filter = ("status",)
     search_fields = ("btc_address", "txid")
     readonly_fields = ("btc_address", "derivation_index", "btc_usd_rate", "expected_satoshis", "received_satoshis", "confirmations", "txid", "confirmed_at")
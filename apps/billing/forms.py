@@ -3,6 +3,9 @@ from decimal import Decimal
 from django import forms
 from django.forms import inlineformset_factory
 
+from apps.leases.models import Lease
+from apps.properties.models import Property, Unit
+
 from .models import (
     BillingCycle,
     Invoice,
@@ -26,10 +29,9 @@ class InvoiceForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        from apps.leases.models import Lease
-
+        # Lease labels render tenant and "property - unit", so join all three
         self.fields["lease"].queryset = Lease.objects.filter(status="active").select_related(
-            "tenant", "unit"
+            "tenant", "unit__property"
         )
         self.fields["billing_cycle"].required = False
 
@@ -68,7 +70,9 @@ InvoiceEditLineItemFormSet = inlineformset_factory(
 
 class RecordPaymentForm(forms.Form):
     invoice = forms.ModelChoiceField(
-        queryset=Invoice.objects.filter(status__in=["issued", "partial", "overdue"]),
+        queryset=Invoice.objects.filter(
+            status__in=["issued", "partial", "overdue"]
+        ).select_related("tenant"),
         label="Invoice",
     )
     amount = forms.DecimalField(
@@ -136,17 +140,15 @@ class UtilityConfigForm(forms.ModelForm):
         return cleaned
 
 
-def get_utility_config_formset():
-    from apps.properties.models import Unit
-    return inlineformset_factory(
-        Unit,
-        UtilityConfig,
-        form=UtilityConfigForm,
-        extra=0,
-        can_delete=False,
-        min_num=0,
-        validate_min=False,
-    )
+UtilityConfigFormSet = inlineformset_factory(
+    Unit,
+    UtilityConfig,
+    form=UtilityConfigForm,
+    extra=0,
+    can_delete=False,
+    min_num=0,
+    validate_min=False,
+)
 
 
 class BulkUtilityConfigForm(forms.Form):
@@ -167,8 +169,8 @@ class BulkUtilityConfigForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        from apps.properties.models import Property
-        self.fields["property"].queryset = Property.objects.filter(is_active=True)
+        # The choice label and the bulk-set view only use pk and name
+        self.fields["property"].queryset = Property.objects.filter(is_active=True).only("pk", "name")
 
     def clean(self):
         cleaned = super().clean()
@@ -240,6 +242,9 @@ class TenantPaymentForm(forms.Form):
 # ---------------------------------------------------------------------------
 
 
+ENVIRONMENT_CHOICES = (("sandbox", "Sandbox"), ("production", "Production"))
+
+
 class GatewayBaseForm(forms.ModelForm):
     class Meta:
         model = PaymentGatewayConfig
@@ -255,9 +260,8 @@ class ProviderConfigForm(forms.Form):
     def __init__(self, *args, config_data=None, **kwargs):
         super().__init__(*args, **kwargs)
         if config_data:
-            for field_name, field in self.fields.items():
-                if field_name in config_data:
-                    self.fields[field_name].initial = config_data[field_name]
+            for field_name in self.fields.keys() & config_data.keys():
+                self.initial.setdefault(field_name, config_data[field_name])
 
     def get_config_data(self):
         """Return cleaned data as a dict for the config JSONField."""
@@ -313,7 +317,7 @@ class SquareConfigForm(ProviderConfigForm):
         help_text="From Square Dashboard \u2192 Locations",
     )
     environment = forms.ChoiceField(
-        choices=[("sandbox", "Sandbox"), ("production", "Production")],
+        choices=ENVIRONMENT_CHOICES,
         widget=forms.Select(attrs={"class": "form-control"}),
     )
     webhook_signature_key = forms.CharField(
@@ -345,7 +349,7 @@ class AuthorizeNetConfigForm(ProviderConfigForm):
         help_text="Public key for Accept.js",
     )
     environment = forms.ChoiceField(
-        choices=[("sandbox", "Sandbox"), ("production", "Production")],
+        choices=ENVIRONMENT_CHOICES,
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
@@ -362,7 +366,7 @@ class BraintreeConfigForm(ProviderConfigForm):
         widget=forms.PasswordInput(attrs={"class": "form-control"}),
     )
     environment = forms.ChoiceField(
-        choices=[("sandbox", "Sandbox"), ("production", "Production")],
+        choices=ENVIRONMENT_CHOICES,
         widget=forms.Select(attrs={"class": "form-control"}),
     )
 
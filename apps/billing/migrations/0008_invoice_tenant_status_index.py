@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0007_bitcoinpricesnapshot_alter_payment_method_and_more'),
+        ('leases', '0003_add_prospective_tenant_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['tenant', 'status'], name='billing_inv_tenant__f82d44_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0008_invoice_tenant_status_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='paymentgatewayconfig',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('is_default',), name='billing_single_default_gateway'),
+        ),
+    ]
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Sum
 
 from apps.core.models import AuditMixin, TimeStampedModel
@@ -31,17 +31,29 @@ class PaymentGatewayConfig(TimeStampedModel):
 
     class Meta:
         ordering = ["-is_default", "provider"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_default"],
+                condition=models.Q(is_default=True),
+                name="billing_single_default_gateway",
+            ),
+        ]
 
     def __str__(self):
         default = " (Default)" if self.is_default else ""
         return f"{self.display_name}{default}"
 
     def save(self, *args, **kwargs):
+        # Clearing the previous default and saving happen together, and
+        # billing_single_default_gateway rejects a concurrent second default
         if self.is_default:
-            PaymentGatewayConfig.objects.filter(is_default=True).exclude(pk=self.pk).update(
-                is_default=False
-            )
-        super().save(*args, **kwargs)
+            with transaction.atomic():
+                PaymentGatewayConfig.objects.filter(is_default=True).exclude(pk=self.pk).update(
+                    is_default=False
+                )
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
 
 
 class BillingCycle(TimeStampedModel):
@@ -94,6 +106,9 @@ class Invoice(TimeStampedModel, AuditMixin):
 
     class Meta:
         ordering = ["-issue_date"]
+        indexes = [
+            models.Index(fields=["tenant", "status"]),
+        ]
 
     def __str__(self):
         return f"Invoice {self.invoice_number} - {self.tenant}"
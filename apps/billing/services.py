@@ -52,10 +52,11 @@ class InvoiceService:
                 created_by=created_by,
             )
 
+            # One INSERT for all line items; bulk_create skips
+            # InvoiceLineItem.save, so amount is computed here the same way
             charges = InvoiceService._gather_charges(lease, issue_date)
-            total = Decimal("0.00")
-            for charge in charges:
-                item = InvoiceLineItem.objects.create(
+            items = [
+                InvoiceLineItem(
                     invoice=invoice,
                     charge_type=charge["charge_type"],
                     description=charge["description"],
@@ -64,9 +65,11 @@ class InvoiceService:
                     amount=charge["amount"] * charge.get("quantity", 1),
                     billing_mode=charge.get("billing_mode", ""),
                 )
-                total += item.amount
+                for charge in charges
+            ]
+            InvoiceLineItem.objects.bulk_create(items)
 
-            invoice.total_amount = total
+            invoice.total_amount = sum((item.amount for item in items), Decimal("0.00"))
             invoice.save(update_fields=["total_amount"])
 
         return invoice
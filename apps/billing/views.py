@@ -3,7 +3,8 @@ from decimal import Decimal
 
 from django.contrib import messages
 from django.db import transaction
-from django.db.models import Q, Sum
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
@@ -27,7 +28,7 @@ from .forms import (
     RecordPaymentForm,
     RecurringChargeForm,
     TenantPaymentForm,
-    get_utility_config_formset,
+    UtilityConfigFormSet,
 )
 from .models import (
     ApiToken,
@@ -66,19 +67,12 @@ def admin_invoice_list(request):
     status_choices = Invoice.STATUS_CHOICES
 
     # Summary stats
-    total_outstanding = (
-        Invoice.objects.filter(status__in=["issued", "partial", "overdue"])
-        .aggregate(total=Sum("total_amount"))
-        .get("total")
-        or Decimal("0.00")
-    )
-    total_paid_amount = (
-        Invoice.objects.filter(status__in=["issued", "partial", "overdue"])
-        .aggregate(total=Sum("amount_paid"))
-        .get("total")
-        or Decimal("0.00")
-    )
-    balance_outstanding = total_outstanding - total_paid_amount
+    balance_outstanding = Invoice.objects.filter(
+        status__in=["issued", "partial", "overdue"]
+    ).aggregate(
+        balance=Coalesce(Sum("total_amount"), Decimal("0.00"))
+        - Coalesce(Sum("amount_paid"), Decimal("0.00")),
+    )["balance"]
 
     context = {
         "invoices": invoices,
@@ -622,8 +616,6 @@ def admin_utility_config_unit(request, unit_pk):
                 billing_mode="included", rate=Decimal("0.00"), is_active=False,
             )
 
-    UtilityConfigFormSet = get_utility_config_formset()
-
     if request.method == "POST":
         formset = UtilityConfigFormSet(request.POST, instance=unit)
         if formset.is_valid():
@@ -831,12 +823,20 @@ def tenant_billing_dashboard(request):
     invoices = Invoice.objects.filter(tenant=tenant).order_by("-issue_date")
     outstanding_invoices = invoices.filter(status__in=["issued", "partial", "overdue"])
 
-    total_balance = Decimal("0.00")
-    for inv in outstanding_invoices:
-        total_balance += inv.balance_due
+    # Balance and count of open invoices in one aggregate instead of loading
+    # every outstanding row to sum balance_due in Python
+    outstanding = outstanding_invoices.aggregate(
+        total_balance=Coalesce(Sum("total_amount"), Decimal("0.00"))
+        - Coalesce(Sum("amount_paid"), Decimal("0.00")),
+        outstanding_count=Count("pk"),
+    )
 
     recent_invoices = invoices[:5]
-    recent_payments = Payment.objects.filter(tenant=tenant).order_by("-payment_date")[:5]
+    recent_payments = (
+        Payment.objects.filter(tenant=tenant)
+        .select_related("invoice")
+        .order_by("-payment_date")[:5]
+    )
 
     # Available prepayment credits
     available_credit = (
@@ -877,8 +877,8 @@ def tenant_billing_dashboard(request):
     reward_balance = reward_balance_obj.balance
 
     context = {
-        "total_balance": total_balance,
-        "outstanding_count": outstanding_invoices.count(),
+        "total_balance": outstanding["total_balance"],
+        "outstanding_count": outstanding["outstanding_count"],
         "recent_invoices": recent_invoices,
         "recent_payments": recent_payments,
         "available_credit": available_credit,
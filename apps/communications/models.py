@@ -71,6 +71,14 @@ class Notification(TimeStampedModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Only unread rows are indexed; they are what the badges count
+            models.Index(
+                fields=["recipient"],
+                condition=models.Q(is_read=False),
+                name="comm_notification_unread_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} -> {self.recipient}"
@@ -20,10 +20,11 @@ def app_launcher_context(request):
     if not getattr(request.user, 'is_admin_user', False):
         return {}
 
-    from apps.core.dashboard_data import get_app_tiles, CATEGORY_INFO
+    from apps.core.dashboard_data import get_all_badge_counts, get_app_tiles, CATEGORY_INFO
 
     try:
         tiles = get_app_tiles()
+        badges = get_all_badge_counts(request, tiles)
 
         # Convert tiles to JSON-serializable format with resolved URLs
         tiles_data = []
@@ -33,13 +34,7 @@ def app_launcher_context(request):
             except NoReverseMatch:
                 url = '#'
 
-            # Calculate badge if function exists
-            badge = 0
-            if tile.badge_func:
-                try:
-                    badge = tile.badge_func(request)
-                except Exception:
-                    badge = 0
+            badge = badges.get(tile.id, 0)
 
             tiles_data.append({
                 'id': tile.id,
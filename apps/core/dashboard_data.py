@@ -5,8 +5,19 @@ Defines all app tiles, categories, and badge notification logic
 for the modern admin dashboard launcher.
 """
 
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
 from django.urls import reverse
 
+from apps.core.query_utils import scalar_subquery, sql_count
+
+logger = logging.getLogger(__name__)
+
+BADGE_CACHE_KEY = "admin_badges:v1"
+BADGE_CACHE_TIMEOUT = 60
+
 
 class AppTile:
     """Represents a single app tile in the launcher."""
@@ -20,7 +31,7 @@ class AppTile:
         url,
         category,
         gradient,
-        badge_func=None,
+        badge_query=None,
         favorite=False,
         keywords=None,
     ):
@@ -31,16 +42,10 @@ class AppTile:
         self.url = url
         self.category = category
         self.gradient = gradient
-        self.badge_func = badge_func
+        self.badge_query = badge_query  # Callable returning the queryset to count
         self.favorite = favorite
         self.keywords = keywords or []
 
-    def get_badge_count(self, request):
-        """Calculate badge count for this app."""
-        if self.badge_func:
-            return self.badge_func(request)
-        return 0
-
 
 def get_app_tiles():
     """Return all app tile definitions."""
@@ -97,7 +102,7 @@ def get_app_tiles():
             url="leases_admin:lease_list",
             category="leases",
             gradient="teal",
-            badge_func=lambda req: _get_pending_signatures(),
+            badge_query=_pending_signatures,
             keywords=["contracts", "agreements", "terms"],
         ),
         AppTile(
@@ -128,7 +133,7 @@ def get_app_tiles():
             url="tenant_lifecycle_admin:admin_session_list",
             category="leases",
             gradient="teal",
-            badge_func=lambda req: _get_active_onboarding_sessions(),
+            badge_query=_active_onboarding_sessions,
             keywords=["onboard", "move-in", "new tenant", "invite"],
         ),
         AppTile(
@@ -150,7 +155,7 @@ def get_app_tiles():
             url="billing_admin:invoice_list",
             category="billing",
             gradient="green",
-            badge_func=lambda req: _get_overdue_invoices(),
+            badge_query=_overdue_invoices,
             keywords=["bills", "charges", "statements"],
         ),
         AppTile(
@@ -222,7 +227,7 @@ def get_app_tiles():
             url="workorders_admin:workorder_list",
             category="maintenance",
             gradient="orange",
-            badge_func=lambda req: _get_emergency_workorders(),
+            badge_query=_emergency_workorders,
             keywords=["maintenance", "repairs", "tickets", "service"],
         ),
         # ===== Tenant Programs =====
@@ -447,50 +452,85 @@ def get_app_tiles():
 # ===== Badge Calculation Helpers =====
 
 
-def _get_overdue_invoices():
-    """Get count of overdue invoices."""
-    try:
-        from apps.billing.models import Invoice
+def get_all_badge_counts(request, tiles=None):
+    """
+    Return badge counts keyed by tile id.
 
-        return Invoice.objects.filter(status="overdue").count()
-    except Exception:
-        return 0
+    Badges are global (none depend on the requesting user), so every
+    tile's count is selected in a single query and the result is cached
+    briefly for all admin pages. If that query fails, each tile is counted
+    on its own so one broken app only blanks its own badge, and nothing is
+    cached so the next page load tries again.
+    """
+    counts = cache.get(BADGE_CACHE_KEY)
+    if counts is not None:
+        return counts
 
+    from apps.accounts.models import User
 
-def _get_pending_signatures():
-    """Get count of leases with pending signatures."""
+    badge_tiles = [
+        tile for tile in (tiles if tiles is not None else get_app_tiles()) if tile.badge_query
+    ]
     try:
-        from apps.documents.models import EDocument
-
-        return EDocument.objects.filter(status__in=["pending", "partial"]).count()
+        # Savepoint so a failed subquery doesn't poison an outer transaction
+        with transaction.atomic():
+            # Piggyback on the requesting user's row as the one-row source
+            row = User.objects.filter(pk=request.user.pk).values(
+                **{
+                    f"badge_{tile.id}": scalar_subquery(tile.badge_query(), sql_count())
+                    for tile in badge_tiles
+                }
+            ).get()
     except Exception:
-        return 0
+        logger.exception("Failed to calculate dashboard badge counts in one query")
+        return _count_badges_individually(badge_tiles)
 
+    counts = {tile.id: row[f"badge_{tile.id}"] for tile in badge_tiles}
+    cache.set(BADGE_CACHE_KEY, counts, BADGE_CACHE_TIMEOUT)
+    return counts
 
-def _get_emergency_workorders():
-    """Get count of emergency work orders that are still open."""
-    try:
-        from apps.workorders.models import WorkOrder
 
-        return (
-            WorkOrder.objects.filter(priority="emergency")
-            .exclude(status__in=["completed", "closed"])
-            .count()
-        )
-    except Exception:
-        return 0
+def _count_badges_individually(badge_tiles):
+    """Count each tile's badge separately, isolating failures per tile."""
+    counts = {}
+    for tile in badge_tiles:
+        try:
+            with transaction.atomic():
+                counts[tile.id] = tile.badge_query().count()
+        except Exception:
+            logger.exception("Failed to calculate badge count for %s", tile.id)
+            counts[tile.id] = 0
+    return counts
 
 
-def _get_active_onboarding_sessions():
-    """Get count of active onboarding sessions (in progress)."""
-    try:
-        from apps.tenant_lifecycle.models import OnboardingSession
+def _overdue_invoices():
+    """Overdue invoices."""
+    from apps.billing.models import Invoice
 
-        return OnboardingSession.objects.filter(
-            status__in=["invited", "started", "in_progress"]
-        ).count()
-    except Exception:
-        return 0
+    return Invoice.objects.filter(status="overdue")
+
+
+def _pending_signatures():
+    """Lease documents with pending signatures."""
+    from apps.documents.models import EDocument
+
+    return EDocument.objects.filter(status__in=["pending", "partial"])
+
+
+def _emergency_workorders():
+    """Emergency work orders that are still open."""
+    from apps.workorders.models import WorkOrder
+
+    return WorkOrder.objects.filter(priority="emergency").exclude(
+        status__in=["completed", "closed"]
+    )
+
+
+def _active_onboarding_sessions():
+    """Active onboarding sessions (in progress)."""
+    from apps.tenant_lifecycle.models import OnboardingSession
+
+    return OnboardingSession.objects.filter(status__in=["invited", "started", "in_progress"])
 
 
 # ===== Category Information =====
@@ -76,13 +76,10 @@ def get_financial_metrics(start_date, end_date, property_ids=None):
     if property_ids:
         outstanding_filters &= Q(lease__unit__property_id__in=property_ids)
 
-    outstanding = Invoice.objects.filter(outstanding_filters).aggregate(
-        total=Coalesce(Sum("total_amount"), Decimal("0")),
-        paid=Coalesce(Sum("amount_paid"), Decimal("0")),
-    )
-    outstanding_balance = (outstanding["total"] or Decimal("0")) - (
-        outstanding["paid"] or Decimal("0")
-    )
+    outstanding_balance = Invoice.objects.filter(outstanding_filters).aggregate(
+        balance=Coalesce(Sum("total_amount"), Decimal("0"))
+        - Coalesce(Sum("amount_paid"), Decimal("0")),
+    )["balance"]
 
     # Overdue count
     overdue_count = Invoice.objects.filter(
@@ -172,10 +169,12 @@ def get_workorder_metrics(start_date, end_date, property_ids=None):
     )
 
     # Total and completed counts
-    total_in_period = work_orders.count()
-    completed_in_period = work_orders.filter(
-        status__in=["completed", "closed"]
-    ).count()
+    period_counts = work_orders.aggregate(
+        total=Count("id"),
+        completed=Count("id", filter=Q(status__in=["completed", "closed"])),
+    )
+    total_in_period = period_counts["total"]
+    completed_in_period = period_counts["completed"]
 
     # Average resolution time (days from created to completed)
     completed_with_dates = work_orders.filter(
@@ -208,13 +207,13 @@ def get_workorder_metrics(start_date, end_date, property_ids=None):
         .values_list("priority", "count")
     )
 
-    # Emergency work orders currently open
-    emergency_open = WorkOrder.objects.filter(
-        open_filters, priority="emergency"
-    ).count()
-
-    # Total open
-    total_open = WorkOrder.objects.filter(open_filters).count()
+    # Total open and emergency work orders currently open
+    open_counts = WorkOrder.objects.filter(open_filters).aggregate(
+        total=Count("id"),
+        emergency=Count("id", filter=Q(priority="emergency")),
+    )
+    emergency_open = open_counts["emergency"]
+    total_open = open_counts["total"]
 
     return {
         "status_counts": status_counts,
@@ -1,9 +1,50 @@
+import time
 from functools import wraps
 
-from django.http import Http404, HttpResponseForbidden
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, HttpResponseForbidden
 from django.shortcuts import redirect
 
 
+def get_client_ip(request):
+    """Client IP, taken from X-Forwarded-For only as far as TRUSTED_PROXY_COUNT allows."""
+    proxies = settings.TRUSTED_PROXY_COUNT
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+    if proxies and forwarded:
+        hops = [ip.strip() for ip in forwarded.split(",")]
+        return hops[-min(proxies, len(hops))]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def login_rate_limit(view_func):
+    """
+    Reject POSTs with 429 once an IP has LOGIN_RATE_LIMIT failed attempts per window.
+
+    Only failed POSTs count: every successful login/OTP step redirects,
+    while a failure re-renders the form.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method != "POST":
+            return view_func(request, *args, **kwargs)
+
+        window = settings.LOGIN_RATE_LIMIT_WINDOW
+        key = f"login_ip:{view_func.__name__}:{get_client_ip(request)}:{int(time.time() // window)}"
+        if cache.get(key, 0) >= settings.LOGIN_RATE_LIMIT:
+            return HttpResponse("Too many login attempts. Please try again later.", status=429)
+
+        response = view_func(request, *args, **kwargs)
+        if not 300 <= response.status_code < 400:
+            cache.add(key, 0, window)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, window)
+        return response
+    return wrapper
+
+
 def tenant_required(view_func):
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
@@ -1,8 +1,23 @@
+import secrets
+import time
 import uuid
 from django.conf import settings
 from django.db import models
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+
+    48-bit millisecond timestamp followed by random bits, so new primary
+    keys land at the right edge of the B-tree instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class TimeStampedModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -63,26 +78,23 @@ class SystemSettings(models.Model):
     def __str__(self):
         return "System Settings"
     
+    CACHE_KEY = "system_settings"
+    CACHE_TIMEOUT = 3600
+
     @classmethod
     def get_settings(cls):
-        """Get or create the singleton settings instance."""
+        """Get or create the singleton settings instance (cached until saved)."""
         from django.core.cache import cache
-        settings, _ = cls.objects.get_or_create(pk=1)
+        settings = cache.get(cls.CACHE_KEY)
+        if settings is None:
+            settings, _ = cls.objects.get_or_create(pk=1)
+            cache.set(cls.CACHE_KEY, settings, cls.CACHE_TIMEOUT)
         return settings
     
     @classmethod
     def get_openweathermap_api_key(cls):
         """Get OpenWeatherMap API key with caching."""
-        from django.core.cache import cache
-        cache_key = "system_settings_owm_api_key"
-        cached = cache.get(cache_key)
-        if cached is not None:
-            return cached
-        
-        settings = cls.get_settings()
-        key = settings.openweathermap_api_key
-        cache.set(cache_key, key, 300)  # Cache for 5 minutes
-        return key
+        return cls.get_settings().openweathermap_api_key
     
     def save(self, *args, **kwargs):
         """Ensure only one instance exists and clear cache on save."""
@@ -90,7 +102,7 @@ class SystemSettings(models.Model):
         self.pk = 1
         super().save(*args, **kwargs)
         # Clear cache when settings are updated
-        cache.delete("system_settings_owm_api_key")
+        cache.delete(self.CACHE_KEY)
     
     def delete(self, *args, **kwargs):
         """Prevent deletion of the singleton."""
@@ -0,0 +1,29 @@
+"""ORM helpers for selecting several independent aggregates in one query."""
+
+from django.db.models import F, Func, IntegerField, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def sql_count():
+    """COUNT(*) as a plain function call, so no GROUP BY is added."""
+    return Func(Value(1), function="COUNT", output_field=IntegerField())
+
+
+def sql_sum(field):
+    """SUM(field) as a plain function call, so no GROUP BY is added."""
+    return Func(F(field), function="SUM")
+
+
+def scalar_subquery(queryset, expression, default=0, output_field=None):
+    """
+    One-row subquery evaluating ``expression`` over ``queryset``.
+
+    Lets several independent counts/sums be selected together in a single
+    query instead of one round trip each.
+    """
+    output_field = output_field or IntegerField()
+    return Coalesce(
+        Subquery(queryset.order_by().values(value=expression), output_field=output_field),
+        Value(default),
+        output_field=output_field,
+    )
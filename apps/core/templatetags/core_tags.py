@@ -11,6 +11,31 @@ def currency(value):
         return value
 
 
+STATUS_COLORS = {
+    "active": "success",
+    "paid": "success",
+    "completed": "success",
+    "closed": "success",
+    "renewed": "info",
+    "issued": "info",
+    "assigned": "info",
+    "invited": "info",
+    "partial": "warning",
+    "pending": "warning",
+    "started": "warning",
+    "in_progress": "warning",
+    "overdue": "danger",
+    "failed": "danger",
+    "terminated": "danger",
+}
+
+
+@register.filter
+def status_color(value):
+    """Bootstrap contextual color for a model status value."""
+    return STATUS_COLORS.get(value, "secondary")
+
+
 @register.filter
 def phone_format(value):
     if not value:
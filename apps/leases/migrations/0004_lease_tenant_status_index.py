@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leases', '0003_add_prospective_tenant_fields'),
+        ('properties', '0002_property_manager_email_property_manager_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['tenant', 'status'], name='leases_leas_tenant__9c2189_idx'),
+        ),
+    ]
@@ -140,6 +140,9 @@ class Lease(TimeStampedModel, AuditMixin):
 
     class Meta:
         ordering = ["-start_date"]
+        indexes = [
+            models.Index(fields=["tenant", "status"]),
+        ]
 
     def __str__(self):
         tenant_display = self.display_tenant_name
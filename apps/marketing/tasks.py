@@ -84,10 +84,10 @@ def generate_campaign_recipients(campaign_id):
     for segment in campaign.segments.all():
         tenant_ids.update(_resolve_segment_tenants(segment))
 
-    tenants = User.objects.filter(id__in=tenant_ids, is_active=True)
+    tenants = User.objects.filter(id__in=tenant_ids, is_active=True).only("pk", "email")
 
     created_count = 0
-    for tenant in tenants:
+    for tenant in tenants.iterator():
         _, created = CampaignRecipient.objects.get_or_create(
             campaign=campaign,
             tenant=tenant,
@@ -272,8 +272,9 @@ def send_campaign(campaign_id):
     sent_count = 0
     failed_count = 0
 
-    for recipient in recipients:
-        success = send_campaign_email(str(recipient.pk))
+    # send_campaign_email loads each recipient itself, so only stream the ids
+    for recipient_pk in recipients.values_list("pk", flat=True).iterator():
+        success = send_campaign_email(str(recipient_pk))
         if success:
             sent_count += 1
         else:
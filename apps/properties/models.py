@@ -48,14 +48,6 @@ class Property(TimeStampedModel, AuditMixin):
         parts.append(f"{self.city}, {self.state} {self.zip_code}")
         return ", ".join(parts)
 
-    @property
-    def occupied_units_count(self):
-        return self.units.filter(status="occupied").count()
-
-    @property
-    def vacant_units_count(self):
-        return self.units.filter(status="vacant").count()
-
 
 class Unit(TimeStampedModel):
     STATUS_CHOICES = [
@@ -1,4 +1,5 @@
 from django.contrib import messages
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404, redirect, render
 
 from apps.core.decorators import admin_required
@@ -7,9 +8,17 @@ from .forms import PropertyForm, UnitForm
 from .models import Property, Unit
 
 
+def _with_unit_counts(queryset):
+    """Annotate properties with occupied/vacant unit counts in one pass."""
+    return queryset.annotate(
+        occupied_count=Count("units", filter=Q(units__status="occupied")),
+        vacant_count=Count("units", filter=Q(units__status="vacant")),
+    )
+
+
 @admin_required
 def property_list(request):
-    properties = Property.objects.all()
+    properties = _with_unit_counts(Property.objects.all())
     status_filter = request.GET.get("status")
     if status_filter == "active":
         properties = properties.filter(is_active=True)
@@ -32,7 +41,7 @@ def property_create(request):
 
 @admin_required
 def property_detail(request, pk):
-    prop = get_object_or_404(Property, pk=pk)
+    prop = get_object_or_404(_with_unit_counts(Property.objects.all()), pk=pk)
     units = prop.units.all()
     return render(request, "properties/admin_property_detail.html", {"property": prop, "units": units})
 
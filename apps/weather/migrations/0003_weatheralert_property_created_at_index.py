@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_property_manager_email_property_manager_name_and_more'),
+        ('weather', '0002_weathernotificationrule_weatherruledispatchlog'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='weatheralert',
+            index=models.Index(fields=['property', '-created_at'], name='weather_wea_propert_7f59ef_idx'),
+        ),
+    ]
@@ -76,6 +76,12 @@ class WeatherAlert(TimeStampedModel):
     notification_sent = models.BooleanField(default=False)
     sent_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["property", "-created_at"]),
+        ]
+
     def __str__(self):
         return f"{self.title} ({self.severity})"
 
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_property_manager_email_property_manager_name_and_more'),
+        ('workorders', '0002_workorderattachment_delete_workorderimage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workorder',
+            index=models.Index(fields=['reported_by', 'status'], name='workorders__reporte_c8bc03_idx'),
+        ),
+    ]
@@ -55,6 +55,12 @@ class WorkOrder(TimeStampedModel, AuditMixin):
     cost_estimate = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     actual_cost = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
 
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["reported_by", "status"]),
+        ]
+
     def __str__(self):
         return f"WO-{self.pk.__str__()[:8]}: {self.title}"
 
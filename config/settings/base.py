@@ -222,6 +222,14 @@ OPENWEATHERMAP_API_KEY = env("OPENWEATHERMAP_API_KEY", default="")
 OTP_LENGTH = 6
 OTP_EXPIRY_MINUTES = 10
 OTP_MAX_REQUESTS_PER_HOUR = 5
+# Key for hashing stored OTP codes (defaults to SECRET_KEY)
+OTP_PEPPER = get_secret("otp_pepper", SECRET_KEY)
+
+# Login throttling (POSTs per client IP per window)
+LOGIN_RATE_LIMIT = 5
+LOGIN_RATE_LIMIT_WINDOW = 15 * 60  # seconds
+# Reverse proxies in front of the app whose X-Forwarded-For entries are trusted
+TRUSTED_PROXY_COUNT = env.int("TRUSTED_PROXY_COUNT", default=0)
 
 # Login URLs
 LOGIN_URL = "/tenant/login/"